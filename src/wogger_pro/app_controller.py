@@ -281,6 +281,8 @@ class ApplicationController:
         # Pause prompt processing while we migrate files
         self._prompt_manager.stop()
         reset_logging(reconfigure=False)
+        if self._repository is not None:
+            self._repository.close()
         try:
             self._move_app_data_contents(old_resolved, new_resolved)
         except Exception as exc:
@@ -47,6 +47,25 @@ class CategoryManager:
         categories.append(normalized)
         self._save(categories)
 
+    def add_categories(self, names: Iterable[str]) -> int:
+        """Append ``names`` with a single save; a rejected name leaves the store unchanged."""
+        categories = self._load()
+        keys = {item.lower() for item in categories}
+        added = 0
+        for name in names:
+            normalized = _normalize(name)
+            if not normalized:
+                raise ValueError("Category name must be non-empty")
+            key = normalized.lower()
+            if key in keys:
+                raise ValueError(f"Category already exists: {normalized}")
+            categories.append(normalized)
+            keys.add(key)
+            added += 1
+        if added:
+            self._save(categories)
+        return added
+
     def rename_category(self, old_name: str, new_name: str) -> None:
         old_normalized = _normalize(old_name)
         new_normalized = _normalize(new_name)
@@ -4,15 +4,19 @@ from __future__ import annotations
 
 import csv
 import json
+import secrets
+from bisect import bisect_left
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
+from itertools import accumulate
 from pathlib import Path
-from typing import Sequence
+from typing import Any, Callable, Sequence
 
 from .models import Entry
-from .time_segments import TimeRange, subtract
+from .time_segments import IntervalSet, TimeRange, subtract
 
 REQUIRED_COLUMNS = {"date", "start time", "end time", "duration (min)", "task"}
+CSV_COLUMN_ORDER = ("date", "start time", "end time", "duration (min)", "task")
 
 
 class ImportValidationError(ValueError):
@@ -38,23 +42,22 @@ def parse_wogger_csv(path: Path) -> list[Entry]:
 
     try:
         with path.open("r", encoding="utf-8-sig", newline="") as handle:
-            reader = csv.DictReader(handle)
-            if reader.fieldnames is None:
+            reader = csv.reader(handle)
+            header = next(reader, None)
+            if header is None:
                 raise ImportValidationError("CSV file is missing a header row.")
-            header_lookup = {name.strip().lower(): name for name in reader.fieldnames if name}
+            header_lookup = {name.strip().lower(): index for index, name in enumerate(header) if name}
             missing = REQUIRED_COLUMNS - set(header_lookup)
             if missing:
                 raise ImportValidationError(
                     "CSV file is missing required columns: " + ", ".join(sorted(missing))
                 )
 
-            entries: list[Entry] = []
-            for index, row in enumerate(reader, start=2):
-                try:
-                    entry = _row_to_entry(row, header_lookup)
-                except ImportValidationError as exc:  # re-wrap with row context
-                    raise ImportValidationError(f"Row {index}: {exc}") from exc
-                entries.append(entry)
+            columns = tuple(header_lookup[name] for name in CSV_COLUMN_ORDER)
+            width = max(columns) + 1
+            # Blank lines are skipped, matching csv.DictReader's row numbering.
+            rows = list(enumerate((row for row in reader if row), start=2))
+        entries = _convert_items(rows, lambda row: _row_to_entry(row, columns, width), "Row")
     except ImportValidationError:
         raise
     except Exception as exc:  # pragma: no cover - unexpected parsing failure
@@ -109,12 +112,111 @@ def merge_entries(
     )
 
 
-def _row_to_entry(row: dict[str, str], header_lookup: dict[str, str]) -> Entry:
-    date_value = _cell(row, header_lookup, "date")
-    start_value = _cell(row, header_lookup, "start time")
-    end_value = _cell(row, header_lookup, "end time")
-    duration_value = _cell(row, header_lookup, "duration (min)")
-    task_value = _cell(row, header_lookup, "task")
+def _convert_items(
+    items: list[tuple[int, Any]],
+    convert: Callable[[Any], Entry],
+    label: str,
+) -> list[Entry]:
+    """Convert numbered payloads to entries, re-wrapping validation errors with their position."""
+
+    def _convert(numbered: tuple[int, Any]) -> Entry:
+        index, item = numbered
+        try:
+            return convert(item)
+        except ImportValidationError as exc:  # re-wrap with row context
+            raise ImportValidationError(f"{label} {index}: {exc}") from exc
+
+    return [_convert(item) for item in items]
+
+
+def _parse_date(value: str) -> date:
+    text = value.strip()
+    parsed = _fast_parse_date(text)
+    if parsed is not None:
+        return parsed
+    for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y"):
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    raise ImportValidationError(f"Invalid date value: {value!r}")
+
+
+def _parse_time(value: str) -> time:
+    text = value.strip()
+    parsed = _fast_parse_time(text)
+    if parsed is not None:
+        return parsed
+    for fmt in ("%H:%M", "%H:%M:%S"):
+        try:
+            return datetime.strptime(text, fmt).time()
+        except ValueError:
+            continue
+    raise ImportValidationError(f"Invalid time value: {value!r}")
+
+
+def _fast_parse_date(text: str) -> date | None:
+    """Parse the common date layouts by slicing; ``None`` defers to ``strptime``."""
+
+    try:
+        if len(text) == 10 and text[4] == "-" and text[7] == "-":
+            if not (text.isascii() and text[0:4].isdigit() and text[5:7].isdigit() and text[8:10].isdigit()):
+                return None
+            return date(int(text[0:4]), int(text[5:7]), int(text[8:10]))
+        parts = text.split("/")
+        if (
+            len(parts) == 3
+            and len(parts[2]) == 4
+            and parts[2].isascii()
+            and parts[2].isdigit()
+            and all(_is_short_number(part) for part in parts[:2])
+        ):
+            first, second, year = int(parts[0]), int(parts[1]), int(parts[2])
+            try:
+                return date(year, first, second)
+            except ValueError:
+                return date(year, second, first)
+    except ValueError:
+        return None
+    return None
+
+
+def _fast_parse_time(text: str) -> time | None:
+    """Parse ``H:M`` / ``H:M:S`` by slicing; ``None`` defers to ``strptime``."""
+
+    parts = text.split(":")
+    if len(parts) not in (2, 3) or not all(_is_short_number(part) for part in parts):
+        return None
+    try:
+        return time(*(int(part) for part in parts))
+    except ValueError:
+        return None
+
+
+def _is_short_number(text: str) -> bool:
+    return 0 < len(text) <= 2 and text.isascii() and text.isdigit()
+
+
+def _row_to_entry(
+    row: list[str],
+    columns: tuple[int, ...],
+    width: int,
+    *,
+    _parse_date: Callable[[str], date] = _parse_date,
+    _parse_time: Callable[[str], time] = _parse_time,
+    _combine: Callable[[date, time], datetime] = datetime.combine,
+    _timedelta: type[timedelta] = timedelta,
+    _entry: type[Entry] = Entry,
+) -> Entry:
+    # Helpers are bound as defaults so the per-row body runs on fast locals, not global lookups.
+    if len(row) < width:
+        row = row + [""] * (width - len(row))
+    date_index, start_index, end_index, duration_index, task_index = columns
+    date_value = row[date_index].strip()
+    start_value = row[start_index].strip()
+    end_value = row[end_index].strip()
+    duration_value = row[duration_index].strip()
+    task_value = row[task_index]
 
     task = task_value.strip()
     if not task:
@@ -122,7 +224,7 @@ def _row_to_entry(row: dict[str, str], header_lookup: dict[str, str]) -> Entry:
 
     date_obj = _parse_date(date_value)
     start_time = _parse_time(start_value)
-    start = datetime.combine(date_obj, start_time)
+    start = _combine(date_obj, start_time)
 
     try:
         duration_minutes = int(duration_value)
@@ -131,43 +233,20 @@ def _row_to_entry(row: dict[str, str], header_lookup: dict[str, str]) -> Entry:
     if duration_minutes <= 0:
         raise ImportValidationError("Duration (min) must be positive.")
 
-    expected_end = start + timedelta(minutes=duration_minutes)
     end_time = _parse_time(end_value)
-    end = datetime.combine(date_obj, end_time)
+    end = _combine(date_obj, end_time)
 
     if end <= start:
         # Assume the entry wrapped to the next day only when contiguous.
-        end = start + timedelta(minutes=duration_minutes)
+        end = start + _timedelta(minutes=duration_minutes)
     else:
         delta_minutes = int((end - start).total_seconds() // 60)
         if abs(delta_minutes - duration_minutes) > 1:
             raise ImportValidationError("End time does not match duration.")
         # Prefer the precise duration from the CSV when they align.
-        end = start + timedelta(minutes=duration_minutes)
-
-    return Entry(task=task, segment_start=start, segment_end=end, minutes=duration_minutes)
-
-
-def _cell(row: dict[str, str], header_lookup: dict[str, str], key: str) -> str:
-    return row.get(header_lookup[key], "").strip()
-
-
-def _parse_date(value: str) -> datetime.date:
-    for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y"):
-        try:
-            return datetime.strptime(value.strip(), fmt).date()
-        except ValueError:
-            continue
-    raise ImportValidationError(f"Invalid date value: {value!r}")
+        end = start + _timedelta(minutes=duration_minutes)
 
-
-def _parse_time(value: str) -> datetime.time:
-    for fmt in ("%H:%M", "%H:%M:%S"):
-        try:
-            return datetime.strptime(value.strip(), fmt).time()
-        except ValueError:
-            continue
-    raise ImportValidationError(f"Invalid time value: {value!r}")
+    return _entry(task=task, segment_start=start, segment_end=end, minutes=duration_minutes)
 
 
 def _entry_key(entry: Entry):
@@ -196,15 +275,7 @@ def parse_jf_loggr_json(path: Path) -> list[Entry]:
     if not isinstance(entries_payload, list):
         raise ImportValidationError("JSON file is missing an 'entries' list.")
 
-    entries: list[Entry] = []
-    for index, item in enumerate(entries_payload, start=1):
-        if not isinstance(item, dict):
-            raise ImportValidationError(f"Entry {index}: expected an object.")
-        try:
-            entry = _jf_loggr_item_to_entry(item)
-        except ImportValidationError as exc:
-            raise ImportValidationError(f"Entry {index}: {exc}") from exc
-        entries.append(entry)
+    entries = _convert_items(list(enumerate(entries_payload, start=1)), _jf_loggr_item_to_entry, "Entry")
 
     if not entries:
         raise ImportValidationError("The JSON file does not contain any entries to import.")
@@ -213,7 +284,9 @@ def parse_jf_loggr_json(path: Path) -> list[Entry]:
     return entries
 
 
-def _jf_loggr_item_to_entry(payload: dict[str, object]) -> Entry:
+def _jf_loggr_item_to_entry(payload: object) -> Entry:
+    if not isinstance(payload, dict):
+        raise ImportValidationError("expected an object.")
     try:
         day_value = str(payload["day"]).strip()
     except KeyError as exc:
@@ -285,7 +358,17 @@ def _prefer_imported_merge(
     trimmed_count = 0
     minutes_removed = 0
 
+    # import_ranges is sorted by start, so a prefix maximum of the ends tells us whether any
+    # import starting before an entry's end also reaches past its start.
+    import_starts = [rng.start for rng in import_ranges]
+    import_max_ends = list(accumulate((rng.end for rng in import_ranges), max))
+
     for entry in existing_entries:
+        candidates = bisect_left(import_starts, entry.segment_end)
+        if not candidates or import_max_ends[candidates - 1] <= entry.segment_start:
+            trimmed_entries.append(entry)
+            continue
+
         base_range = entry.as_range()
         remainders = subtract(base_range, import_ranges)
 
@@ -320,13 +403,14 @@ def _prefer_existing_merge(
 ) -> tuple[list[Entry], list[Entry], int, int]:
     merged_entries = list(existing_entries)
     applied_entries: list[Entry] = []
-    occupied_ranges = list(existing_ranges)
+    # Grows with every applied remainder, so each import row is checked against one merged index.
+    occupied = IntervalSet(existing_ranges)
     discarded_count = 0
     discarded_minutes = 0
 
     for entry in imported_entries:
         base_range = entry.as_range()
-        remainders = subtract(base_range, occupied_ranges)
+        remainders = occupied.subtract(base_range)
 
         if not remainders:
             discarded_count += 1
@@ -340,7 +424,7 @@ def _prefer_existing_merge(
             new_entry = _entry_from_range(entry.task, rng, minutes)
             applied_entries.append(new_entry)
             merged_entries.append(new_entry)
-            occupied_ranges.append(rng)
+            occupied.add(rng)
 
         trimmed_minutes = max(0, entry.minutes - total_remainder_minutes)
         discarded_minutes += trimmed_minutes
@@ -369,4 +453,5 @@ def _range_minutes(rng: TimeRange) -> int:
 
 
 def _entry_from_range(task: str, rng: TimeRange, minutes: int) -> Entry:
-    return Entry(task=task, segment_start=rng.start, segment_end=rng.end, minutes=minutes)
+    # token_hex skips uuid4's UUID construction; ids only need to be unique, not RFC 4122.
+    return Entry.from_range(task, rng, minutes, secrets.token_hex(16))
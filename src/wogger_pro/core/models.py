@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 import uuid
 
@@ -48,6 +49,25 @@ class Entry:
             category=(str(payload["category"]).strip() or None) if "category" in payload else None,
         )
 
+    @classmethod
+    def from_range(
+        cls,
+        task: str,
+        rng: TimeRange,
+        minutes: int,
+        entry_id: str,
+        category: str | None = None,
+    ) -> "Entry":
+        """Build an entry for a derived range, skipping ``__init__`` and id generation."""
+        entry = object.__new__(cls)
+        entry.task = task
+        entry.segment_start = rng.start
+        entry.segment_end = rng.end
+        entry.minutes = minutes
+        entry.entry_id = entry_id
+        entry.category = category
+        return entry
+
     def as_range(self) -> TimeRange:
         return TimeRange(start=self.segment_start, end=self.segment_end)
 
@@ -109,6 +129,14 @@ class SplitPart:
 
 
 def _parse_datetime(value: str | datetime) -> datetime:
+    if isinstance(value, str):
+        return _parse_datetime_cached(value)
     if isinstance(value, datetime):
         return value
     return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=8192)
+def _parse_datetime_cached(value: str) -> datetime:
+    # Adjacent entries share boundary stamps, so full loads hit this cache often.
+    return datetime.fromisoformat(value)
@@ -25,10 +25,17 @@ FEATURES_FILENAME = "features.json"
 DATA_POINTER_FILENAME = f"{APP_NAME}-data-dir.json"
 
 _DATA_DIR_OVERRIDE: Path | None = None
+# Set once the pointer file is known to be absent; only _store_override can create it again.
+_OVERRIDE_NEGATIVE = False
+_DIRECTORY_NAMES: dict[Path, frozenset[str]] = {}
 
 
+@lru_cache(maxsize=1)
 def _roaming_root() -> Path:
-    """Return the user's roaming application data directory."""
+    """Return the user's roaming application data directory.
+
+    Cached because the environment is not expected to change while the app runs.
+    """
     appdata = os.environ.get("APPDATA")
     if appdata:
         return Path(appdata)
@@ -36,17 +43,23 @@ def _roaming_root() -> Path:
     return Path.home() / "AppData" / "Roaming"
 
 
+@lru_cache(maxsize=1)
 def default_app_data_dir() -> Path:
     return _roaming_root() / APP_NAME
 
 
+@lru_cache(maxsize=1)
 def _override_file() -> Path:
     return _roaming_root() / DATA_POINTER_FILENAME
 
 
 def _load_override() -> Path | None:
+    global _OVERRIDE_NEGATIVE
+    if _OVERRIDE_NEGATIVE:
+        return None
     pointer = _override_file()
     if not pointer.exists():
+        _OVERRIDE_NEGATIVE = True
         return None
     try:
         data = json.loads(pointer.read_text(encoding="utf-8"))
@@ -59,6 +72,8 @@ def _load_override() -> Path | None:
 
 
 def _store_override(path: Path | None) -> None:
+    global _OVERRIDE_NEGATIVE
+    _OVERRIDE_NEGATIVE = False
     pointer = _override_file()
     if path is None:
         with contextlib.suppress(FileNotFoundError):
@@ -75,8 +90,9 @@ def current_app_data_dir() -> Path:
 
 
 def set_app_data_directory(path: Path | str | None) -> Path:
-    global _DATA_DIR_OVERRIDE
+    global _DATA_DIR_OVERRIDE, _OVERRIDE_NEGATIVE
     target = Path(path).expanduser() if path else None
+    _OVERRIDE_NEGATIVE = False
     _DATA_DIR_OVERRIDE = target
     app_data_dir.cache_clear()
     if target is not None:
@@ -130,18 +146,14 @@ def recurring_backup_log_path() -> Path:
 
 def ensure_app_structure() -> None:
     """Proactively create the directory structure the app relies on."""
-    app_data_dir()
-    backups_dir()
-    recurring_backups_dir()
-    log_file = recurring_backup_log_path()
-    if not log_file.exists():
-        log_file.write_text("[]", encoding="utf-8")
-    categories_file = categories_path()
-    if not categories_file.exists():
-        categories_file.write_text("[]", encoding="utf-8")
-    ignore_file = ignored_missing_timeslots_path()
-    if not ignore_file.exists():
-        ignore_file.write_text("[]", encoding="utf-8")
+    base = app_data_dir()
+    # A single parents=True mkdir creates both the backups and recurring backups directories.
+    (base / BACKUPS_DIRNAME / RECURRING_BACKUPS_DIRNAME).mkdir(parents=True, exist_ok=True)
+    with os.scandir(base) as entries:
+        existing = {entry.name for entry in entries}
+    for filename in (RECURRING_BACKUP_LOG_FILENAME, CATEGORIES_FILENAME, IGNORED_MISSING_TIMESLOTS_FILENAME):
+        if filename not in existing:
+            (base / filename).write_text("[]", encoding="utf-8")
 
 
 def default_downloads_dir() -> Path:
@@ -153,58 +165,54 @@ def default_downloads_dir() -> Path:
 @lru_cache(maxsize=1)
 def app_icon_path() -> Path:
     """Locate the application icon within the project tree."""
-    candidates = []
-
-    bundle_root = getattr(sys, "_MEIPASS", None)
-    if bundle_root:
-        base = Path(bundle_root)
-        candidates.extend([
-            base / APP_ICON_FILENAME,
-            base / RESOURCES_DIRNAME / APP_ICON_FILENAME,
-        ])
-
-    package_root = Path(__file__).resolve().parent.parent
-    project_root = package_root.parent.parent
-
-    candidates.extend([
-        package_root.parent / APP_ICON_FILENAME,
-        project_root / APP_ICON_FILENAME,
-        project_root / RESOURCES_DIRNAME / APP_ICON_FILENAME,
-    ])
-    for candidate in candidates:
-        if candidate.exists():
-            return candidate
-
-    # Fallback to the resources directory path even if it does not yet exist.
-    return project_root / RESOURCES_DIRNAME / APP_ICON_FILENAME
+    return _locate_resource(APP_ICON_FILENAME)
 
 
 @lru_cache(maxsize=1)
 def alert_sound_path() -> Path:
     """Locate the alert sound file within the project tree."""
-    candidates = []
+    return _locate_resource(ALERT_SOUND_FILENAME)
+
+
+def _locate_resource(filename: str) -> Path:
+    candidates: list[Path] = []
 
     bundle_root = getattr(sys, "_MEIPASS", None)
     if bundle_root:
         base = Path(bundle_root)
         candidates.extend([
-            base / ALERT_SOUND_FILENAME,
-            base / RESOURCES_DIRNAME / ALERT_SOUND_FILENAME,
+            base / filename,
+            base / RESOURCES_DIRNAME / filename,
         ])
 
     package_root = Path(__file__).resolve().parent.parent
     project_root = package_root.parent.parent
 
     candidates.extend([
-        package_root.parent / ALERT_SOUND_FILENAME,
-        project_root / ALERT_SOUND_FILENAME,
-        project_root / RESOURCES_DIRNAME / ALERT_SOUND_FILENAME,
+        package_root.parent / filename,
+        project_root / filename,
+        project_root / RESOURCES_DIRNAME / filename,
     ])
+    # One directory listing per parent replaces a stat() per candidate.
     for candidate in candidates:
-        if candidate.exists():
+        if os.path.normcase(candidate.name) in _directory_names(candidate.parent):
             return candidate
 
-    return project_root / RESOURCES_DIRNAME / ALERT_SOUND_FILENAME
+    # Fallback to the resources directory path even if it does not yet exist.
+    return project_root / RESOURCES_DIRNAME / filename
+
+
+def _directory_names(directory: Path) -> frozenset[str]:
+    """Return the (normcased) entry names of a resource directory, listing it at most once."""
+    names = _DIRECTORY_NAMES.get(directory)
+    if names is None:
+        try:
+            with os.scandir(directory) as entries:
+                names = frozenset(os.path.normcase(entry.name) for entry in entries)
+        except OSError:
+            names = frozenset()
+        _DIRECTORY_NAMES[directory] = names
+    return names
 
 
 def categories_path() -> Path:
@@ -4,22 +4,24 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, Iterable, Optional, Sequence
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Sequence
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QTimer, Signal
 
 from .exceptions import PersistenceError, SegmentConflictError
 from .models import Entry, ScheduledSegment, SplitPart
 from .segment_utils import SegmentConflict, compute_conflicts, ensure_half_open
-from .time_segments import TimeRange, minutes_between, sort_ranges, subtract
-from .repository import EntriesRepository
-from .scheduler import PromptScheduler
+from .time_segments import TimeRange, minutes_between, subtract
+
+if TYPE_CHECKING:  # pragma: no cover - annotations only; keeps croniter/portalocker off the import path
+    from .repository import EntriesRepository
+    from .scheduler import PromptScheduler
 
 
 class PromptManager(QObject):
     """Coordinates scheduled prompts and persists user responses."""
 
-    prompt_ready: Signal = Signal(object)
+    prompts_ready: Signal = Signal(list)
     segment_completed: Signal = Signal(str, object)
     segment_split: Signal = Signal(str, object)
     segment_dismissed: Signal = Signal(str)
@@ -39,8 +41,11 @@ class PromptManager(QObject):
         self._repository = repository
         self._logger = logger or logging.getLogger("wogger.prompts")
         self._pending_segments: dict[str, ScheduledSegment] = {}
+        self._pending_snapshot: tuple[ScheduledSegment, ...] | None = None
         self._last_task: Optional[str] = None
         self._category_cache: Dict[str, str | None] = {}
+        # Segments waiting for the next event-loop turn, so a burst is delivered in one emission.
+        self._ready_batch: list[ScheduledSegment] = []
 
         self._scheduler.segment_ready.connect(self._handle_segment_ready)
 
@@ -54,7 +59,9 @@ class PromptManager(QObject):
         self._scheduler.stop()
 
     def pending_segments(self) -> Sequence[ScheduledSegment]:
-        return tuple(self._pending_segments.values())
+        if self._pending_snapshot is None:
+            self._pending_snapshot = tuple(self._pending_segments.values())
+        return self._pending_snapshot
 
     def last_task(self) -> Optional[str]:
         if self._last_task:
@@ -105,10 +112,21 @@ class PromptManager(QObject):
     def segment_remainders(self, segment: ScheduledSegment) -> list[TimeRange]:
         entries = self._repository.get_entries_overlapping(segment.segment_start, segment.segment_end)
         base = segment.as_range()
-        subtractors = [entry.as_range() for entry in entries]
-        if not subtractors:
+        if not entries:
             return [base]
-        return sort_ranges(subtract(base, subtractors))
+        if len(entries) == 1:
+            # Common single-overlap case: at most a head and a tail remain, already in order.
+            cut = base.intersect(entries[0].as_range())
+            if cut is None:
+                return [base]
+            remainders: list[TimeRange] = []
+            if cut.start > base.start:
+                remainders.append(TimeRange(start=base.start, end=cut.start))
+            if cut.end < base.end:
+                remainders.append(TimeRange(start=cut.end, end=base.end))
+            return remainders
+        # subtract() emits remainders in ascending order, so no re-sort is needed.
+        return subtract(base, [entry.as_range() for entry in entries])
 
     def entries_around_range(
         self,
@@ -209,7 +227,7 @@ class PromptManager(QObject):
     def create_virtual_segment(self, start: datetime, end: datetime) -> ScheduledSegment:
         minutes = max(1, minutes_between(start, end))
         segment = ScheduledSegment(segment_start=start, segment_end=end, minutes=minutes)
-        self._pending_segments[segment.segment_id] = segment
+        self._store_pending(segment)
         self._logger.debug(
             "Virtual remainder segment created",
             extra={
@@ -225,33 +243,29 @@ class PromptManager(QObject):
     def log_remainder_entries(self, segment_id: str, remainders: Sequence[TimeRange], tasks: Sequence[str]) -> list[Entry]:
         if len(remainders) != len(tasks):
             raise ValueError("Task assignments must match remainder count")
-        segment = self._pending_segments.pop(segment_id, None)
+        segment = self._take_pending(segment_id)
         if segment is None:
             raise KeyError(f"Unknown segment: {segment_id}")
 
-        normalized_tasks: list[str] = []
-        for task in tasks:
-            value = task.strip()
-            if not value:
-                raise ValueError("Task is required for each remainder")
-            normalized_tasks.append(value)
+        normalized_tasks = [task.strip() for task in tasks]
+        if not all(normalized_tasks):
+            raise ValueError("Task is required for each remainder")
+        durations = [minutes_between(rng.start, rng.end) for rng in remainders]
+        if durations and min(durations) < 1:
+            raise ValueError("Remainder duration must be at least one minute")
 
         category_map = self._categories_for_tasks(normalized_tasks)
 
-        entries: list[Entry] = []
-        for rng, task_name in zip(remainders, normalized_tasks):
-            minutes = minutes_between(rng.start, rng.end)
-            if minutes < 1:
-                raise ValueError("Remainder duration must be at least one minute")
-            entries.append(
-                Entry(
-                    task=task_name,
-                    segment_start=rng.start,
-                    segment_end=rng.end,
-                    minutes=minutes,
-                    category=category_map.get(task_name),
-                )
+        entries = [
+            Entry(
+                task=task_name,
+                segment_start=rng.start,
+                segment_end=rng.end,
+                minutes=minutes,
+                category=category_map.get(task_name),
             )
+            for rng, task_name, minutes in zip(remainders, normalized_tasks, durations)
+        ]
 
         try:
             persisted = self._repository.add_entries_batch(entries)
@@ -260,7 +274,7 @@ class PromptManager(QObject):
                 "Failed to persist remainder entries",
                 extra={"event": "remainder_persist_failed", "segment_id": segment_id},
             )
-            self._pending_segments[segment_id] = segment
+            self._store_pending(segment)
             raise
 
         self._last_task = normalized_tasks[-1]
@@ -282,7 +296,7 @@ class PromptManager(QObject):
         segment = self._pop_segment(segment_id)
         normalized_task = task.strip()
         if not normalized_task:
-            self._pending_segments[segment.segment_id] = segment
+            self._store_pending(segment)
             raise ValueError("Task cannot be empty")
         category = self._resolve_category_for_task(normalized_task)
         try:
@@ -298,7 +312,7 @@ class PromptManager(QObject):
                 "Failed to persist segment",
                 extra={"event": "prompt_persist_failed", "segment_id": segment.segment_id},
             )
-            self._pending_segments[segment.segment_id] = segment
+            self._store_pending(segment)
             self.error_occurred.emit(exc)
             raise
 
@@ -331,7 +345,7 @@ class PromptManager(QObject):
         for part in parts_list:
             value = part.task.strip()
             if not value:
-                self._pending_segments[segment.segment_id] = segment
+                self._store_pending(segment)
                 raise ValueError("Task is required for each split part")
             normalized_tasks.append(value)
 
@@ -359,7 +373,7 @@ class PromptManager(QObject):
                 "Failed to persist split entries",
                 extra={"event": "prompt_split_failed", "segment_id": segment.segment_id},
             )
-            self._pending_segments[segment.segment_id] = segment
+            self._store_pending(segment)
             self.error_occurred.emit(exc)
             raise
 
@@ -378,7 +392,7 @@ class PromptManager(QObject):
         return persisted
 
     def dismiss_segment(self, segment_id: str, reason: str | None = None) -> None:
-        segment = self._pending_segments.pop(segment_id, None)
+        segment = self._take_pending(segment_id)
         if not segment:
             return
         self._logger.info(
@@ -392,12 +406,12 @@ class PromptManager(QObject):
         self.segment_dismissed.emit(segment_id)
 
     def requeue_segment(self, segment: ScheduledSegment) -> None:
-        self._pending_segments[segment.segment_id] = segment
+        self._store_pending(segment)
         self._logger.info(
             "Segment requeued",
             extra={"event": "prompt_requeued", "segment_id": segment.segment_id},
         )
-        self.prompt_ready.emit(segment)
+        self._queue_ready(segment)
 
     # ------------------------------------------------------------------
     def _resolve_category_for_task(self, task: str) -> str | None:
@@ -433,7 +447,7 @@ class PromptManager(QObject):
 
     # ------------------------------------------------------------------
     def _handle_segment_ready(self, segment: ScheduledSegment) -> None:
-        self._pending_segments[segment.segment_id] = segment
+        self._store_pending(segment)
         self._logger.info(
             "Prompt created",
             extra={
@@ -444,10 +458,34 @@ class PromptManager(QObject):
                 "minutes": segment.minutes,
             },
         )
-        self.prompt_ready.emit(segment)
+        self._queue_ready(segment)
+
+    def _queue_ready(self, segment: ScheduledSegment) -> None:
+        self._ready_batch.append(segment)
+        if len(self._ready_batch) == 1:
+            QTimer.singleShot(0, self._flush_ready_batch)
+
+    def _flush_ready_batch(self) -> None:
+        batch, self._ready_batch = self._ready_batch, []
+        # Segments resolved while the batch was queued no longer need a prompt.
+        batch = [segment for segment in batch if segment.segment_id in self._pending_segments]
+        if batch:
+            self.prompts_ready.emit(batch)
 
     def _pop_segment(self, segment_id: str) -> ScheduledSegment:
-        segment = self._pending_segments.pop(segment_id, None)
+        segment = self._take_pending(segment_id)
         if not segment:
             raise KeyError(f"Unknown segment: {segment_id}")
         return segment
+
+    # Every mutation of ``_pending_segments`` goes through these two helpers so the
+    # snapshot returned by ``pending_segments`` is rebuilt only after a change.
+    def _store_pending(self, segment: ScheduledSegment) -> None:
+        self._pending_segments[segment.segment_id] = segment
+        self._pending_snapshot = None
+
+    def _take_pending(self, segment_id: str) -> ScheduledSegment | None:
+        segment = self._pending_segments.pop(segment_id, None)
+        if segment is not None:
+            self._pending_snapshot = None
+        return segment
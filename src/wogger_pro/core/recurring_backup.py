@@ -4,10 +4,17 @@ from __future__ import annotations
 
 import json
 import logging
-from dataclasses import dataclass
+import os
+from bisect import insort
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Sequence
+from typing import BinaryIO, List, Sequence
+
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
 
 from .backup import create_appdata_backup
 from .exceptions import BackupError
@@ -19,6 +26,13 @@ ISO_FORMAT = "%Y-%m-%dT%H:%M:%S"
 MAX_RECURRING_BACKUPS = 100
 MAX_LOG_ENTRIES = 300
 
+# Backups that were created at some point vs. backups whose file may still be on disk.
+_COMPLETED_STATUSES = frozenset({"success", "deleted", "delete_failed"})
+_ACTIVE_STATUSES = frozenset({"success", "delete_failed"})
+
+# Parsed log keyed by (path, mtime_ns, size); callers always receive copies since they mutate entries.
+_LOG_CACHE: tuple[tuple[Path, int, int], list[BackupLogEntry]] | None = None
+
 
 @dataclass(slots=True)
 class BackupLogEntry:
@@ -32,31 +46,28 @@ class BackupLogEntry:
     def to_dict(self) -> dict[str, str | None]:
         payload = {
             "path": self.path,
-            "created_at": self.created_at.strftime(ISO_FORMAT),
+            "created_at": self.created_at.isoformat(timespec="seconds"),
             "status": self.status,
             "error": self.error,
-            "deleted_at": self.deleted_at.strftime(ISO_FORMAT) if self.deleted_at else None,
+            "deleted_at": self.deleted_at.isoformat(timespec="seconds") if self.deleted_at else None,
             "deletion_error": self.deletion_error,
         }
         return payload
 
     @classmethod
     def from_dict(cls, payload: dict[str, object]) -> "BackupLogEntry":
-        created_raw = str(payload.get("created_at"))
-        created_at = datetime.strptime(created_raw, ISO_FORMAT)
-        deleted_raw = payload.get("deleted_at")
-        deleted_at = (
-            datetime.strptime(str(deleted_raw), ISO_FORMAT)
-            if isinstance(deleted_raw, str) and deleted_raw
-            else None
-        )
+        get = payload.get
+        created_at = datetime.fromisoformat(str(get("created_at")))
+        deleted_raw = get("deleted_at")
+        error = get("error")
+        deletion_error = get("deletion_error")
         return cls(
-            path=str(payload.get("path", "")),
+            path=str(get("path", "")),
             created_at=created_at,
-            status=str(payload.get("status", "success")),
-            error=str(payload.get("error", "")) if payload.get("error") else None,
-            deleted_at=deleted_at,
-            deletion_error=str(payload.get("deletion_error", "")) if payload.get("deletion_error") else None,
+            status=str(get("status", "success")),
+            error=str(error) if error else None,
+            deleted_at=datetime.fromisoformat(deleted_raw) if isinstance(deleted_raw, str) and deleted_raw else None,
+            deletion_error=str(deletion_error) if deletion_error else None,
         )
 
 
@@ -76,7 +87,11 @@ def process_recurring_backups(
     target_directory: Path,
     now: datetime | None = None,
 ) -> RecurringBackupOutcome:
-    """Handle cleanup and optional creation of a recurring backup."""
+    """Handle cleanup and optional creation of a recurring backup.
+
+    Log entries are kept sorted by ``created_at`` (oldest first), so the helpers below read the
+    newest backup from the tail and trim the oldest ones from the head.
+    """
 
     clock = now or datetime.now()
     entries = _load_log_entries()
@@ -107,13 +122,13 @@ def process_recurring_backups(
             status="failed",
             error=str(exc),
         )
-        entries.append(entry)
+        insort(entries, entry, key=_created_at)
         _trim_backup_log(entries, MAX_LOG_ENTRIES)
         _save_log_entries(entries)
         return RecurringBackupOutcome(attempted=True, success=False, error=exc)
 
     entry = BackupLogEntry(path=str(backup_path), created_at=clock, status="success")
-    entries.append(entry)
+    insort(entries, entry, key=_created_at)
     _trim_backup_log(entries, MAX_LOG_ENTRIES)
     _save_log_entries(entries)
     LOGGER.info(
@@ -123,6 +138,10 @@ def process_recurring_backups(
     return RecurringBackupOutcome(attempted=True, success=True, backup_path=backup_path)
 
 
+def _created_at(entry: BackupLogEntry) -> datetime:
+    return entry.created_at
+
+
 def _backup_due(entries: Sequence[BackupLogEntry], interval_days: int, now: datetime) -> bool:
     if interval_days < 1:
         interval_days = 1
@@ -134,8 +153,8 @@ def _backup_due(entries: Sequence[BackupLogEntry], interval_days: int, now: date
 
 
 def _last_completed_backup(entries: Sequence[BackupLogEntry]) -> BackupLogEntry | None:
-    for entry in sorted(entries, key=lambda item: item.created_at, reverse=True):
-        if entry.status in {"success", "deleted", "delete_failed"}:
+    for entry in reversed(entries):
+        if entry.status in _COMPLETED_STATUSES:
             return entry
     return None
 
@@ -144,30 +163,19 @@ def _cleanup_outdated_backups(entries: Sequence[BackupLogEntry], retention_days:
     if retention_days < 1:
         retention_days = 1
     cutoff = now - timedelta(days=retention_days)
-    changed = False
-    for entry in entries:
-        if entry.created_at <= cutoff and entry.status in {"success", "delete_failed"} and entry.deleted_at is None:
-            backup_path = Path(entry.path)
-            try:
-                if backup_path.exists():
-                    backup_path.unlink()
-                entry.status = "deleted"
-                entry.deleted_at = now
-                entry.deletion_error = None
-                changed = True
-                LOGGER.info(
-                    "Recurring backup pruned",
-                    extra={"event": "backup_recurring_pruned", "path": entry.path},
-                )
-            except Exception as exc:  # pragma: no cover - filesystem dependent
-                entry.status = "delete_failed"
-                entry.deletion_error = str(exc)
-                LOGGER.exception(
-                    "Failed to delete old recurring backup",
-                    extra={"event": "backup_recurring_prune_failed", "path": entry.path},
-                )
-                changed = True
-    return changed
+    outdated = [
+        entry
+        for entry in entries
+        if entry.created_at <= cutoff and entry.status in _ACTIVE_STATUSES and entry.deleted_at is None
+    ]
+    return _delete_backups(
+        outdated,
+        now,
+        message="Recurring backup pruned",
+        event="backup_recurring_pruned",
+        failure_message="Failed to delete old recurring backup",
+        failure_event="backup_recurring_prune_failed",
+    )
 
 
 def _prune_excess_backups(
@@ -180,35 +188,45 @@ def _prune_excess_backups(
     active = [
         entry
         for entry in entries
-        if entry.status in {"success", "delete_failed"} and entry.deleted_at is None
+        if entry.status in _ACTIVE_STATUSES and entry.deleted_at is None
     ]
     if len(active) <= max_backups:
         return False
 
-    active.sort(key=lambda item: item.created_at)
-    changed = False
-    while len(active) > max_backups:
-        entry = active.pop(0)
-        backup_path = Path(entry.path)
+    return _delete_backups(
+        active[: len(active) - max_backups],
+        now,
+        message="Recurring backup pruned to enforce limit",
+        event="backup_recurring_pruned_limit",
+        failure_message="Failed to delete recurring backup while enforcing max count",
+        failure_event="backup_recurring_limit_failed",
+    )
+
+
+def _delete_backups(
+    entries: Sequence[BackupLogEntry],
+    now: datetime,
+    *,
+    message: str,
+    event: str,
+    failure_message: str,
+    failure_event: str,
+) -> bool:
+    """Delete the backup files for ``entries`` in one pass and record the outcome on each entry."""
+    for entry in entries:
         try:
-            if backup_path.exists():
-                backup_path.unlink()
-            entry.status = "deleted"
-            entry.deleted_at = now
-            entry.deletion_error = None
-            LOGGER.info(
-                "Recurring backup pruned to enforce limit",
-                extra={"event": "backup_recurring_pruned_limit", "path": entry.path},
-            )
+            # missing_ok avoids a separate exists() stat per file.
+            Path(entry.path).unlink(missing_ok=True)
         except Exception as exc:  # pragma: no cover - filesystem dependent
             entry.status = "delete_failed"
             entry.deletion_error = str(exc)
-            LOGGER.exception(
-                "Failed to delete recurring backup while enforcing max count",
-                extra={"event": "backup_recurring_limit_failed", "path": entry.path},
-            )
-        changed = True
-    return changed
+            LOGGER.exception(failure_message, extra={"event": failure_event, "path": entry.path})
+            continue
+        entry.status = "deleted"
+        entry.deleted_at = now
+        entry.deletion_error = None
+        LOGGER.info(message, extra={"event": event, "path": entry.path})
+    return bool(entries)
 
 
 def _trim_backup_log(entries: List[BackupLogEntry], max_entries: int) -> bool:
@@ -217,11 +235,8 @@ def _trim_backup_log(entries: List[BackupLogEntry], max_entries: int) -> bool:
     if len(entries) <= max_entries:
         return False
 
-    removed = 0
-    while len(entries) > max_entries:
-        oldest = min(entries, key=lambda item: item.created_at)
-        entries.remove(oldest)
-        removed += 1
+    removed = len(entries) - max_entries
+    del entries[:removed]
 
     if removed:
         LOGGER.info(
@@ -232,15 +247,20 @@ def _trim_backup_log(entries: List[BackupLogEntry], max_entries: int) -> bool:
 
 
 def _load_log_entries() -> List[BackupLogEntry]:
+    global _LOG_CACHE
     log_path = recurring_backup_log_path()
-    if not log_path.exists():
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        log_path.write_text("[]", encoding="utf-8")
-        return []
     try:
-        raw = json.loads(log_path.read_text(encoding="utf-8"))
+        key = _log_cache_key(log_path)
+        if _LOG_CACHE is not None and _LOG_CACHE[0] == key:
+            return [replace(entry) for entry in _LOG_CACHE[1]]
+        with log_path.open("rb") as handle:
+            raw = _load_log(handle)
         if not isinstance(raw, list):
             raise ValueError("Log payload is not a list")
+    except FileNotFoundError:
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        log_path.write_text("[]", encoding="utf-8")
+        return []
     except Exception:
         LOGGER.exception("Recurring backup log corrupted; resetting", extra={"event": "backup_recurring_log_corrupt"})
         log_path.write_text("[]", encoding="utf-8")
@@ -254,10 +274,38 @@ def _load_log_entries() -> List[BackupLogEntry]:
             entries.append(BackupLogEntry.from_dict(payload))
         except Exception:
             LOGGER.debug("Skipping malformed recurring backup log entry", exc_info=True)
+    entries.sort(key=_created_at)
+    _LOG_CACHE = (key, [replace(entry) for entry in entries])
     return entries
 
 
 def _save_log_entries(entries: Sequence[BackupLogEntry]) -> None:
+    global _LOG_CACHE
     log_path = recurring_backup_log_path()
     payload = [entry.to_dict() for entry in entries]
-    log_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    # Write-then-rename so a crash never leaves a truncated log behind.
+    temp_path = log_path.with_suffix(".json.tmp")
+    with temp_path.open("wb") as outfile:
+        outfile.write(_dumps_log(payload))
+        outfile.flush()
+        os.fsync(outfile.fileno())
+    temp_path.replace(log_path)
+    _LOG_CACHE = (_log_cache_key(log_path), [replace(entry) for entry in entries])
+
+
+def _log_cache_key(log_path: Path) -> tuple[Path, int, int]:
+    stat = log_path.stat()
+    return log_path, stat.st_mtime_ns, stat.st_size
+
+
+def _load_log(handle: BinaryIO) -> object:
+    if orjson is not None:
+        return orjson.loads(handle.read())
+    return json.load(handle)
+
+
+def _dumps_log(payload: list[dict[str, str | None]]) -> bytes:
+    # Compact output: the log is machine-maintained, so indentation only adds bytes to write.
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
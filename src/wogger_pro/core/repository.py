@@ -5,18 +5,202 @@ from __future__ import annotations
 import json
 import logging
 import os
-from collections import Counter
+import shutil
+import tempfile
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from collections import Counter, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, Optional, Sequence
+from typing import IO, Callable, Iterable, Iterator, Optional, Sequence
 
 import portalocker
 
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
 from .exceptions import BackupError, PersistenceError, SegmentConflictError
 from .models import Entry
-from .time_segments import TimeRange, minutes_between
+from .time_segments import minutes_between
 from .paths import backups_dir, entries_path
 
+# json.dumps builds a fresh JSONEncoder per call whenever options are passed; build these once.
+_RECORD_ENCODER = json.JSONEncoder(separators=(",", ":"))
+_VALUE_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+# How far back from the cached end offset to look for the last record already parsed.
+_TAIL_WINDOW = 4096
+
+
+def _loads(data: str | bytes) -> object:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _encode_entry(entry: Entry) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(entry.to_json_dict())
+    return _RECORD_ENCODER.encode(entry.to_json_dict()).encode("utf-8")
+
+
+def _encode_lines(entries: Iterable[Entry]) -> bytes:
+    # One buffer per write: a single write() call instead of two per record.
+    return b"".join([_encode_entry(entry) + b"\n" for entry in entries])
+
+
+def _encode_value(value: str) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return _VALUE_ENCODER.encode(value).encode("utf-8")
+
+
+def _copy_renamed(source: IO[bytes], target: IO[bytes], old_task: str, new_task: str) -> int:
+    """Copy log lines from ``source`` to ``target`` renaming ``old_task``; returns the records changed."""
+    # A record whose task is ``old_task`` either contains its JSON encoding verbatim or uses
+    # escapes; every other line is copied through without being parsed.
+    needle = _encode_value(old_task)
+    updated = 0
+    for line in source:
+        if needle in line or b"\\" in line:
+            line, renamed = _rename_task_line(line, old_task, new_task)
+            updated += renamed
+        if not line.endswith(b"\n"):
+            line += b"\n"
+        target.write(line)
+    return updated
+
+
+def _rename_task_line(line: bytes, old_task: str, new_task: str) -> tuple[bytes, bool]:
+    body = line.rstrip(b"\r\n")
+    if not body.strip():
+        return line, False
+    try:
+        entry = Entry.from_json_dict(_loads(body))
+    except Exception:
+        return line, False
+    if entry.task != old_task:
+        return line, False
+    entry.task = new_task
+    return _encode_entry(entry) + line[len(body) :], True
+
+
+def _renamed_counts(counts: Counter[str], old_task: str, new_task: str) -> Counter[str]:
+    renamed = counts.copy()
+    moved = renamed.pop(old_task, 0)
+    if moved:
+        renamed[new_task] += moved
+    return renamed
+
+
+def _copy_contents(source: IO[bytes], target: IO[bytes]) -> None:
+    """Copy an open file in the kernel where the platform supports it, else through a buffer."""
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None:
+        try:
+            while copy_file_range(source.fileno(), target.fileno(), 1 << 30):
+                pass
+            return
+        except OSError:  # pragma: no cover - filesystem dependent
+            source.seek(0)
+            target.seek(0)
+            target.truncate()
+    shutil.copyfileobj(source, target)
+
+
+def _copy_entries(entries: Iterable[Entry]) -> list[Entry]:
+    # Entry is mutable: cached instances never leave the repository, and callers' never enter it.
+    return [replace(entry) for entry in entries]
+
+
+def _recency(entry: Entry) -> tuple[datetime, datetime]:
+    return entry.segment_end, entry.segment_start
+
+
+def _stat_key(stat: os.stat_result) -> tuple[int, int]:
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _same_file(handle: IO[bytes], path: Path) -> bool:
+    try:
+        return os.path.samestat(os.fstat(handle.fileno()), os.stat(path))
+    except FileNotFoundError:
+        return False
+
+
+@dataclass(slots=True)
+class _RangeIndex:
+    """Entries ordered by start time so range queries can bisect instead of scanning."""
+
+    entries: list[Entry]
+    starts: list[datetime]
+    ends: list[datetime]
+    reach: list[datetime]
+    positions: list[int]
+
+    @classmethod
+    def build(cls, entries: Sequence[Entry]) -> "_RangeIndex":
+        order = sorted(range(len(entries)), key=lambda position: entries[position].segment_start)
+        ordered = [entries[position] for position in order]
+        reach: list[datetime] = []
+        latest: datetime | None = None
+        for entry in ordered:
+            if latest is None or entry.segment_end > latest:
+                latest = entry.segment_end
+            reach.append(latest)
+        return cls(
+            entries=ordered,
+            starts=[entry.segment_start for entry in ordered],
+            ends=[entry.segment_end for entry in ordered],
+            reach=reach,
+            positions=order,
+        )
+
+    def within(self, start_dt: datetime, end_dt: datetime) -> list[Entry]:
+        lo = bisect_left(self.starts, start_dt)
+        hi = bisect_right(self.starts, end_dt)
+        ends = self.ends
+        return self._in_file_order([index for index in range(lo, hi) if ends[index] <= end_dt])
+
+    def overlapping(self, start_dt: datetime, end_dt: datetime) -> list[Entry]:
+        # ``reach`` is the running maximum of end times, so everything before ``lo`` ends by ``start_dt``.
+        lo = bisect_right(self.reach, start_dt)
+        hi = bisect_left(self.starts, end_dt)
+        ends = self.ends
+        return self._in_file_order([index for index in range(lo, hi) if ends[index] > start_dt])
+
+    def _in_file_order(self, indices: list[int]) -> list[Entry]:
+        # Usually already in file order (the log is mostly chronological), which timsort handles in one pass.
+        indices.sort(key=self.positions.__getitem__)
+        entries = self.entries
+        return [entries[index] for index in indices]
+
+
+@dataclass(slots=True)
+class _PendingBatch:
+    """Serialized entries waiting for whichever caller holds the write lock to flush them."""
+
+    entries: Sequence[Entry]
+    payload: bytes
+    done: bool = False
+    error: Exception | None = None
+
+
+@dataclass(slots=True)
+class _EntriesSnapshot:
+    """Parsed log contents tagged with the (mtime_ns, size) they were read at."""
+
+    key: tuple[int, int]
+    entries: list[Entry]
+    index: _RangeIndex | None = None
+    task_counts: Counter[str] | None = None
+    last: Entry | None = None
+
 
 class EntriesRepository:
     """Handles durable persistence of work log entries."""
@@ -26,15 +210,33 @@ class EntriesRepository:
         path: Path | None = None,
         logger: logging.Logger | None = None,
         lock_timeout: float = 10.0,
+        lock_check_interval: float = 0.01,
     ) -> None:
         self._path = Path(path) if path is not None else entries_path()
         self._path.parent.mkdir(parents=True, exist_ok=True)
+        # Locks are taken on this sidecar rather than the log itself, so swapping a rewritten log in
+        # with os.replace never races an open handle of our own (Windows refuses that replace).
+        self._lock_path = self._path.with_name(f"{self._path.name}.lock")
         self._lock_timeout = lock_timeout
+        # Contention is rare for a desktop app, so poll often rather than portalocker's default 0.25 s.
+        self._lock_check_interval = lock_check_interval
         self._logger = logger or logging.getLogger("wogger.repository")
+        self._cache: _EntriesSnapshot | None = None
+        self._cache_lock = threading.Lock()
+        self._pending: deque[_PendingBatch] = deque()
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._writer: IO[bytes] | None = None
+        self._writer_lock_file: IO[bytes] | None = None
         self._ensure_file()
 
     # ------------------------------------------------------------------
     # Public API
+    def close(self) -> None:
+        """Release the persistent append handle, e.g. before the data directory is moved."""
+        with self._write_lock:
+            self._close_writer()
+
     def add_entry(
         self,
         task: str,
@@ -51,18 +253,19 @@ class EntriesRepository:
             minutes=minutes,
             category=normalized_category,
         )
-        self._logger.info(
-            "Adding entry",
-            extra={
-                "event": "entries_add_one",
-                "task": task,
-                "segment_start": segment_start.isoformat(),
-                "segment_end": segment_end.isoformat(),
-                "minutes": minutes,
-                "entry_id": entry.entry_id,
-                "category": normalized_category or "",
-            },
-        )
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(
+                "Adding entry",
+                extra={
+                    "event": "entries_add_one",
+                    "task": task,
+                    "segment_start": segment_start.isoformat(),
+                    "segment_end": segment_end.isoformat(),
+                    "minutes": minutes,
+                    "entry_id": entry.entry_id,
+                    "category": normalized_category or "",
+                },
+            )
         persisted = self.add_entries_batch([entry])
         return persisted[0]
 
@@ -70,87 +273,68 @@ class EntriesRepository:
         if not entries:
             return []
 
-        serialized_entries = [json.dumps(entry.to_json_dict(), separators=(",", ":")) for entry in entries]
-        self._logger.info(
-            "Adding batch of entries",
-            extra={
-                "event": "entries_add_batch",
-                "count": len(entries),
-                "entry_ids": [entry.entry_id for entry in entries],
-            },
-        )
+        payload = _encode_lines(entries)
+        # The extra payloads below are skipped entirely when the level is disabled (hot append path).
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(
+                "Adding batch of entries",
+                extra={
+                    "event": "entries_add_batch",
+                    "count": len(entries),
+                    "entry_ids": [entry.entry_id for entry in entries],
+                },
+            )
 
-        try:
-            with portalocker.Lock(
-                self._path,
-                mode="a+",
-                timeout=self._lock_timeout,
-                flags=portalocker.LockFlags.EXCLUSIVE,
-                encoding="utf-8",
-            ) as locked_file:
-                locked_file.seek(0, os.SEEK_END)
-                start_position = locked_file.tell()
-                try:
-                    for line in serialized_entries:
-                        locked_file.write(line)
-                        locked_file.write("\n")
-                    locked_file.flush()
-                    os.fsync(locked_file.fileno())
-                except Exception as exc:  # pragma: no cover - defensive logic
-                    locked_file.seek(start_position)
-                    locked_file.truncate()
-                    locked_file.flush()
-                    os.fsync(locked_file.fileno())
-                    self._logger.exception("Failed to write batch; truncated partial data")
-                    raise PersistenceError("Unable to persist entries batch") from exc
-        except Exception as exc:
-            if isinstance(exc, PersistenceError):
-                raise
-            self._logger.exception("Unexpected error while writing entries batch")
-            raise PersistenceError("Unable to persist entries batch") from exc
+        # Flat combining: whoever gets the write lock flushes every queued batch with one fsync,
+        # so concurrent callers share the cost while each still returns only once durable.
+        batch = _PendingBatch(entries=entries, payload=payload)
+        with self._pending_lock:
+            self._pending.append(batch)
+        with self._write_lock:
+            if not batch.done:
+                self._flush_pending()
+        if batch.error is not None:
+            if isinstance(batch.error, PersistenceError):
+                raise batch.error
+            raise PersistenceError("Unable to persist entries batch") from batch.error
 
         return list(entries)
 
     def get_all_entries(self) -> list[Entry]:
-        self._logger.debug("Loading all entries", extra={"event": "entries_load_all"})
-        lines = self._read_lines()
-        return self._deserialize_entries(lines)
+        return _copy_entries(self._cached_entries())
 
     def get_entries_by_range(self, start_dt: datetime, end_dt: datetime) -> list[Entry]:
-        self._logger.debug(
-            "Loading entries by range",
-            extra={
-                "event": "entries_load_range",
-                "start": start_dt.isoformat(),
-                "end": end_dt.isoformat(),
-            },
-        )
-        entries = [
-            entry
-            for entry in self.get_all_entries()
-            if entry.segment_start >= start_dt and entry.segment_end <= end_dt
-        ]
-        return entries
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                "Loading entries by range",
+                extra={
+                    "event": "entries_load_range",
+                    "start": start_dt.isoformat(),
+                    "end": end_dt.isoformat(),
+                },
+            )
+        return _copy_entries(self._load_range_index().within(start_dt, end_dt))
+
+    def get_entries_span(self) -> tuple[datetime, datetime] | None:
+        """Earliest segment start and latest segment end in the log, or None when it is empty."""
+        index = self._load_range_index()
+        if not index.starts:
+            return None
+        return index.starts[0], index.reach[-1]
 
     def get_entries_overlapping(self, start_dt: datetime, end_dt: datetime) -> list[Entry]:
-        self._logger.debug(
-            "Loading entries overlapping range",
-            extra={
-                "event": "entries_load_overlap",
-                "start": start_dt.isoformat(),
-                "end": end_dt.isoformat(),
-            },
-        )
-        try:
-            base = TimeRange(start=start_dt, end=end_dt)
-        except ValueError:
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                "Loading entries overlapping range",
+                extra={
+                    "event": "entries_load_overlap",
+                    "start": start_dt.isoformat(),
+                    "end": end_dt.isoformat(),
+                },
+            )
+        if end_dt <= start_dt:
             return []
-
-        overlapping: list[Entry] = []
-        for entry in self.get_all_entries():
-            if entry.as_range().overlaps(base):
-                overlapping.append(entry)
-        return overlapping
+        return _copy_entries(self._load_range_index().overlapping(start_dt, end_dt))
 
     def update_entry(
         self,
@@ -173,15 +357,9 @@ class EntriesRepository:
             raise ValueError("Segment duration must be at least one minute")
 
         try:
-            with portalocker.Lock(
-                self._path,
-                mode="r+",
-                timeout=self._lock_timeout,
-                flags=portalocker.LockFlags.EXCLUSIVE,
-                encoding="utf-8",
-            ) as locked_file:
+            with self._locked("r+b", portalocker.LockFlags.EXCLUSIVE) as locked_file:
                 locked_file.seek(0)
-                lines = [line.rstrip("\n") for line in locked_file if line.strip()]
+                lines = [line for line in locked_file.read().splitlines() if line.strip()]
                 entries = self._deserialize_entries(lines)
 
                 target: Entry | None = None
@@ -193,11 +371,10 @@ class EntriesRepository:
                 if target is None:
                     raise PersistenceError("Entry not found")
 
-                proposed_range = TimeRange(start=segment_start, end=segment_end)
                 for entry in entries:
                     if entry.entry_id == entry_id:
                         continue
-                    if proposed_range.overlaps(entry.as_range()):
+                    if entry.segment_start < segment_end and entry.segment_end > segment_start:
                         raise SegmentConflictError(
                             "The selected time range overlaps another entry."
                         )
@@ -210,12 +387,10 @@ class EntriesRepository:
 
                 locked_file.seek(0)
                 locked_file.truncate()
-                for entry in entries:
-                    serialized = json.dumps(entry.to_json_dict(), separators=(",", ":"))
-                    locked_file.write(serialized)
-                    locked_file.write("\n")
+                locked_file.write(_encode_lines(entries))
                 locked_file.flush()
                 os.fsync(locked_file.fileno())
+                self._store_cache(entries, locked_file)
         except (PersistenceError, SegmentConflictError, ValueError):
             raise
         except Exception as exc:
@@ -237,19 +412,13 @@ class EntriesRepository:
                 "category": normalized_category or "",
             },
         )
-        return target
+        return replace(target)
 
     def delete_entry(self, entry_id: str) -> bool:
         try:
-            with portalocker.Lock(
-                self._path,
-                mode="r+",
-                timeout=self._lock_timeout,
-                flags=portalocker.LockFlags.EXCLUSIVE,
-                encoding="utf-8",
-            ) as locked_file:
+            with self._locked("r+b", portalocker.LockFlags.EXCLUSIVE) as locked_file:
                 locked_file.seek(0)
-                lines = [line.rstrip("\n") for line in locked_file if line.strip()]
+                lines = [line for line in locked_file.read().splitlines() if line.strip()]
                 entries = self._deserialize_entries(lines)
 
                 original_count = len(entries)
@@ -260,12 +429,10 @@ class EntriesRepository:
 
                 locked_file.seek(0)
                 locked_file.truncate()
-                for entry in entries:
-                    serialized = json.dumps(entry.to_json_dict(), separators=(",", ":"))
-                    locked_file.write(serialized)
-                    locked_file.write("\n")
+                locked_file.write(_encode_lines(entries))
                 locked_file.flush()
                 os.fsync(locked_file.fileno())
+                self._store_cache(entries, locked_file)
         except Exception as exc:
             self._logger.exception(
                 "Failed to delete entry",
@@ -280,9 +447,13 @@ class EntriesRepository:
         return True
 
     def list_tasks_with_counts(self) -> list[tuple[str, int]]:
-        entries = self.get_all_entries()
-        counts = Counter(entry.task for entry in entries)
-        ordered = sorted(counts.items(), key=lambda kv: (-kv[1], kv[0].lower()))
+        snapshot = self._snapshot()
+        with self._cache_lock:
+            # Counted once per snapshot, then kept current by appends and renames.
+            if snapshot.task_counts is None:
+                snapshot.task_counts = Counter(entry.task for entry in snapshot.entries)
+            counts = list(snapshot.task_counts.items())
+        ordered = sorted(counts, key=lambda kv: (-kv[1], kv[0].lower()))
         self._logger.debug(
             "Task counts computed",
             extra={"event": "entries_task_counts", "task_count": len(ordered)},
@@ -290,8 +461,7 @@ class EntriesRepository:
         return ordered
 
     def list_categories_with_counts(self) -> list[tuple[str, int]]:
-        entries = self.get_all_entries()
-        counts = Counter(entry.category for entry in entries if entry.category)
+        counts = Counter(entry.category for entry in self._cached_entries() if entry.category)
         ordered = sorted(counts.items(), key=lambda kv: (-kv[1], kv[0].lower()))
         self._logger.debug(
             "Category counts computed",
@@ -300,10 +470,12 @@ class EntriesRepository:
         return ordered
 
     def get_last_entry(self) -> Optional[Entry]:
-        entries = self.get_all_entries()
-        if not entries:
-            return None
-        return max(entries, key=lambda entry: (entry.segment_end, entry.segment_start))
+        snapshot = self._snapshot()
+        with self._cache_lock:
+            if snapshot.last is None and snapshot.entries:
+                snapshot.last = max(snapshot.entries, key=_recency)
+            last = snapshot.last
+        return replace(last) if last is not None else None
 
     def task_category(self, task: str) -> str | None:
         """Return the most recent non-empty category assigned to a task."""
@@ -313,7 +485,7 @@ class EntriesRepository:
             return None
 
         latest: Entry | None = None
-        for entry in self.get_all_entries():
+        for entry in self._cached_entries():
             if entry.task.strip() != normalized_task:
                 continue
             category = (entry.category or "").strip()
@@ -343,35 +515,32 @@ class EntriesRepository:
             },
         )
 
+        temp_path = self._make_temp(".rename.tmp")
         try:
-            with portalocker.Lock(
-                self._path,
-                mode="r+",
-                timeout=self._lock_timeout,
-                flags=portalocker.LockFlags.EXCLUSIVE,
-                encoding="utf-8",
-            ) as locked_file:
-                locked_file.seek(0)
-                lines = [line.rstrip("\n") for line in locked_file if line.strip()]
-                entries = self._deserialize_entries(lines)
-
-                updated = 0
-                for entry in entries:
-                    if entry.task == old_task:
-                        entry.task = new_task
-                        updated += 1
+            while True:
+                # Phase 1: build the renamed copy while other readers can still use the log.
+                with self._locked("rb", portalocker.LockFlags.SHARED) as source_file:
+                    before = _stat_key(os.fstat(source_file.fileno()))
+                    with temp_path.open("wb") as temp_file:
+                        updated = _copy_renamed(source_file, temp_file, old_task, new_task)
+                        temp_file.flush()
+                        os.fsync(temp_file.fileno())
 
                 if updated == 0:
                     return 0
 
-                locked_file.seek(0)
-                locked_file.truncate()
-                for entry in entries:
-                    serialized = json.dumps(entry.to_json_dict(), separators=(",", ":"))
-                    locked_file.write(serialized)
-                    locked_file.write("\n")
-                locked_file.flush()
-                os.fsync(locked_file.fileno())
+                # Phase 2: hold the exclusive lock only to check nothing changed and swap the copy in.
+                with self._swap_lock():
+                    if self._file_key() != before:
+                        continue
+                    after = self._install_rewrite(temp_path)
+                    self._patch_cache(
+                        before,
+                        after,
+                        lambda entry: replace(entry, task=new_task) if entry.task == old_task else entry,
+                        lambda counts: _renamed_counts(counts, old_task, new_task),
+                    )
+                break
         except ValueError:
             raise
         except Exception as exc:
@@ -380,6 +549,8 @@ class EntriesRepository:
                 extra={"event": "entries_task_rename_failed", "from": old_task, "to": new_task},
             )
             raise PersistenceError("Unable to rename task entries") from exc
+        finally:
+            temp_path.unlink(missing_ok=True)
 
         return updated
 
@@ -401,15 +572,9 @@ class EntriesRepository:
         )
 
         try:
-            with portalocker.Lock(
-                self._path,
-                mode="r+",
-                timeout=self._lock_timeout,
-                flags=portalocker.LockFlags.EXCLUSIVE,
-                encoding="utf-8",
-            ) as locked_file:
+            with self._locked("r+b", portalocker.LockFlags.EXCLUSIVE) as locked_file:
                 locked_file.seek(0)
-                lines = [line.rstrip("\n") for line in locked_file if line.strip()]
+                lines = [line for line in locked_file.read().splitlines() if line.strip()]
                 entries = self._deserialize_entries(lines)
 
                 updated = 0
@@ -423,12 +588,10 @@ class EntriesRepository:
 
                 locked_file.seek(0)
                 locked_file.truncate()
-                for entry in entries:
-                    serialized = json.dumps(entry.to_json_dict(), separators=(",", ":"))
-                    locked_file.write(serialized)
-                    locked_file.write("\n")
+                locked_file.write(_encode_lines(entries))
                 locked_file.flush()
                 os.fsync(locked_file.fileno())
+                self._store_cache(entries, locked_file)
         except Exception as exc:
             self._logger.exception(
                 "Failed to rename category",
@@ -449,15 +612,9 @@ class EntriesRepository:
         )
 
         try:
-            with portalocker.Lock(
-                self._path,
-                mode="r+",
-                timeout=self._lock_timeout,
-                flags=portalocker.LockFlags.EXCLUSIVE,
-                encoding="utf-8",
-            ) as locked_file:
+            with self._locked("r+b", portalocker.LockFlags.EXCLUSIVE) as locked_file:
                 locked_file.seek(0)
-                lines = [line.rstrip("\n") for line in locked_file if line.strip()]
+                lines = [line for line in locked_file.read().splitlines() if line.strip()]
                 entries = self._deserialize_entries(lines)
 
                 updated = 0
@@ -471,12 +628,10 @@ class EntriesRepository:
 
                 locked_file.seek(0)
                 locked_file.truncate()
-                for entry in entries:
-                    serialized = json.dumps(entry.to_json_dict(), separators=(",", ":"))
-                    locked_file.write(serialized)
-                    locked_file.write("\n")
+                locked_file.write(_encode_lines(entries))
                 locked_file.flush()
                 os.fsync(locked_file.fileno())
+                self._store_cache(entries, locked_file)
         except Exception as exc:
             self._logger.exception(
                 "Failed to clear category",
@@ -504,15 +659,9 @@ class EntriesRepository:
         )
 
         try:
-            with portalocker.Lock(
-                self._path,
-                mode="r+",
-                timeout=self._lock_timeout,
-                flags=portalocker.LockFlags.EXCLUSIVE,
-                encoding="utf-8",
-            ) as locked_file:
+            with self._locked("r+b", portalocker.LockFlags.EXCLUSIVE) as locked_file:
                 locked_file.seek(0)
-                lines = [line.rstrip("\n") for line in locked_file if line.strip()]
+                lines = [line for line in locked_file.read().splitlines() if line.strip()]
                 entries = self._deserialize_entries(lines)
 
                 updated = 0
@@ -534,12 +683,10 @@ class EntriesRepository:
 
                 locked_file.seek(0)
                 locked_file.truncate()
-                for entry in entries:
-                    serialized = json.dumps(entry.to_json_dict(), separators=(",", ":"))
-                    locked_file.write(serialized)
-                    locked_file.write("\n")
+                locked_file.write(_encode_lines(entries))
                 locked_file.flush()
                 os.fsync(locked_file.fileno())
+                self._store_cache(entries, locked_file)
         except Exception as exc:
             self._logger.exception(
                 "Failed to assign category to task",
@@ -555,23 +702,20 @@ class EntriesRepository:
 
     def replace_all_entries(self, entries: Sequence[Entry]) -> None:
         ordered = sorted(entries, key=lambda entry: (entry.segment_start, entry.segment_end, entry.task.lower()))
+        temp_path = self._make_temp(".import.tmp")
         try:
-            with portalocker.Lock(
-                self._path,
-                mode="w",
-                timeout=self._lock_timeout,
-                flags=portalocker.LockFlags.EXCLUSIVE,
-                encoding="utf-8",
-            ) as locked_file:
-                for entry in ordered:
-                    payload = json.dumps(entry.to_json_dict(), separators=(",", ":"))
-                    locked_file.write(payload)
-                    locked_file.write("\n")
-                locked_file.flush()
-                os.fsync(locked_file.fileno())
+            # Write and fsync the new log before taking the lock, so readers are only blocked for the swap.
+            with temp_path.open("wb") as temp_file:
+                temp_file.write(_encode_lines(ordered))
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            with self._swap_lock():
+                self._adopt_cache(_copy_entries(ordered), self._install_rewrite(temp_path))
         except Exception as exc:
             self._logger.exception("Failed to replace entries", extra={"event": "entries_replace_failed"})
             raise PersistenceError("Unable to persist imported entries") from exc
+        finally:
+            temp_path.unlink(missing_ok=True)
 
     def backup(self) -> Path:
         self._logger.info("Starting backup", extra={"event": "entries_backup_start"})
@@ -581,17 +725,8 @@ class EntriesRepository:
         target_path = target_dir / target_name
 
         try:
-            with portalocker.Lock(
-                self._path,
-                mode="r",
-                timeout=self._lock_timeout,
-                flags=portalocker.LockFlags.SHARED,
-                encoding="utf-8",
-            ) as source_file:
-                data = source_file.read()
-
-            target_path.write_text(data, encoding="utf-8")
-            with target_path.open("r+", encoding="utf-8") as written:
+            with self._locked("rb", portalocker.LockFlags.SHARED) as source_file, target_path.open("wb") as written:
+                _copy_contents(source_file, written)
                 written.flush()
                 os.fsync(written.fileno())
         except Exception as exc:  # pragma: no cover - filesystem dependent
@@ -614,28 +749,279 @@ class EntriesRepository:
             )
             self._path.touch()
 
-    def _read_lines(self) -> list[str]:
+    @contextmanager
+    def _file_lock(self, flags: portalocker.LockFlags) -> Iterator[None]:
+        with portalocker.Lock(
+            self._lock_path,
+            mode="a+b",
+            timeout=self._lock_timeout,
+            check_interval=self._lock_check_interval,
+            flags=flags | portalocker.LockFlags.NON_BLOCKING,
+        ):
+            yield
+
+    @contextmanager
+    def _locked(self, mode: str, flags: portalocker.LockFlags) -> Iterator[IO[bytes]]:
+        """Lock, then open the log; it is only ever replaced under the exclusive lock."""
+        with self._file_lock(flags), open(self._path, mode) as locked_file:
+            yield locked_file
+
+    @contextmanager
+    def _swap_lock(self) -> Iterator[None]:
+        """Hold the exclusive lock with no handle open on the log, ready for ``_install_rewrite``."""
+        # ``_write_lock`` comes first, matching the append path, and keeps the append handle closed.
+        with self._write_lock:
+            self._close_writer()
+            with self._file_lock(portalocker.LockFlags.EXCLUSIVE):
+                yield
+
+    def _make_temp(self, suffix: str) -> Path:
+        """Create a uniquely named file next to the log, so ``os.replace`` stays on one filesystem."""
+        descriptor, temp_name = tempfile.mkstemp(dir=self._path.parent, prefix=f"{self._path.stem}-", suffix=suffix)
+        os.close(descriptor)
+        return Path(temp_name)
+
+    def _install_rewrite(self, temp_path: Path) -> tuple[int, int]:
+        """Swap a written and fsynced temp file in for the log; returns the log's new stat key.
+
+        Needs ``_swap_lock``, so this process holds no handle on the log.
+        """
+        key = _stat_key(temp_path.stat())
+        try:
+            os.replace(temp_path, self._path)
+        except PermissionError:
+            # Only reachable on Windows while another process keeps the log open. The complete temp
+            # file already exists, so fall back to rewriting the log in place from it.
+            with temp_path.open("rb") as source, open(self._path, "r+b") as target:
+                target.truncate()
+                shutil.copyfileobj(source, target)
+                target.flush()
+                os.fsync(target.fileno())
+                key = _stat_key(os.fstat(target.fileno()))
+            temp_path.unlink(missing_ok=True)
+        return key
+
+    def _flush_pending(self) -> None:
+        """Write every queued batch in one locked append. Needs ``_write_lock``."""
+        with self._pending_lock:
+            batches = list(self._pending)
+            self._pending.clear()
+        if not batches:
+            return
+        if len(batches) > 1:
+            self._logger.debug(
+                "Coalescing entry batches",
+                extra={"event": "entries_add_coalesced", "batches": len(batches)},
+            )
         try:
-            with portalocker.Lock(
-                self._path,
-                mode="r",
-                timeout=self._lock_timeout,
-                flags=portalocker.LockFlags.SHARED,
-                encoding="utf-8",
-            ) as locked_file:
-                return [line.rstrip("\n") for line in locked_file if line.strip()]
+            self._append_batches(batches)
+        except Exception as exc:
+            for batch in batches:
+                batch.error = exc
+        finally:
+            for batch in batches:
+                batch.done = True
+
+    def _append_batches(self, batches: Sequence[_PendingBatch]) -> None:
+        try:
+            writer = self._lock_writer()
+            try:
+                before = _stat_key(os.fstat(writer.fileno()))
+                start_position = before[1]
+                try:
+                    writer.write(b"".join([batch.payload for batch in batches]))
+                    writer.flush()
+                    os.fsync(writer.fileno())
+                except Exception as exc:  # pragma: no cover - defensive logic
+                    writer.truncate(start_position)
+                    writer.flush()
+                    os.fsync(writer.fileno())
+                    self._logger.exception("Failed to write batch; truncated partial data")
+                    raise PersistenceError("Unable to persist entries batch") from exc
+                self._extend_cache(before, _copy_entries(entry for batch in batches for entry in batch.entries), writer)
+            finally:
+                portalocker.unlock(self._writer_lock_file)
+        except Exception as exc:
+            if isinstance(exc, PersistenceError):
+                raise
+            self._logger.exception("Unexpected error while writing entries batch")
+            raise PersistenceError("Unable to persist entries batch") from exc
+
+    def _lock_writer(self) -> IO[bytes]:
+        """Take the exclusive lock and return the persistent append handle. Needs ``_write_lock``."""
+        if self._writer_lock_file is None:
+            self._writer_lock_file = open(self._lock_path, "ab")
+        self._lock_handle(self._writer_lock_file)
+        try:
+            # Another process may have swapped in a rewritten log since the handle was opened.
+            if self._writer is not None and not _same_file(self._writer, self._path):
+                self._writer.close()
+                self._writer = None
+            if self._writer is None:
+                self._writer = open(self._path, "ab")
+        except BaseException:
+            portalocker.unlock(self._writer_lock_file)
+            raise
+        return self._writer
+
+    def _lock_handle(self, handle: IO[bytes]) -> None:
+        """Exclusively lock an already open handle, polling like ``portalocker.Lock`` does."""
+        deadline = time.monotonic() + self._lock_timeout
+        while True:
+            try:
+                portalocker.lock(handle, portalocker.LockFlags.EXCLUSIVE | portalocker.LockFlags.NON_BLOCKING)
+                return
+            except portalocker.LockException:
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(self._lock_check_interval)
+
+    def _close_writer(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._writer_lock_file is not None:
+            self._writer_lock_file.close()
+            self._writer_lock_file = None
+
+    def _file_key(self) -> tuple[int, int] | None:
+        try:
+            return _stat_key(self._path.stat())
+        except FileNotFoundError:
+            return None
+
+    def _snapshot(self) -> _EntriesSnapshot:
+        """Return the parsed log, re-reading it only when its stat key changed."""
+        key = self._file_key()
+        with self._cache_lock:
+            cached = self._cache
+        if cached is not None and cached.key == key:
+            return cached
+        # The file is read outside ``_cache_lock`` because writers take it while holding the file lock.
+        snapshot: _EntriesSnapshot | None = None
+        if cached is not None and key is not None and key[1] > cached.key[1]:
+            snapshot = self._read_appended(cached)
+        if snapshot is None:
+            self._logger.debug("Loading all entries", extra={"event": "entries_load_all"})
+            read_key, lines = self._read_lines()
+            snapshot = _EntriesSnapshot(key=read_key or (0, 0), entries=self._deserialize_entries(lines))
+            if read_key is None:
+                return snapshot
+        with self._cache_lock:
+            self._cache = snapshot
+        return snapshot
+
+    def _cached_entries(self) -> list[Entry]:
+        """The cached entries themselves, for read-only use inside the repository."""
+        snapshot = self._snapshot()
+        with self._cache_lock:
+            return list(snapshot.entries)
+
+    def _read_appended(self, cached: _EntriesSnapshot) -> _EntriesSnapshot | None:
+        """Parse only the records appended after ``cached``; None when the log was rewritten instead."""
+        if not cached.entries:
+            return None
+        offset = cached.key[1]
+        window_start = max(0, offset - _TAIL_WINDOW)
+        key, data = self._read_bytes(window_start)
+        if key is None or key[1] < offset:
+            return None
+        head, appended = data[: offset - window_start], data[offset - window_start :]
+        # The last record already parsed must still end exactly at the cached offset.
+        if not head.endswith(b"\n"):
+            return None
+        _, newline, last = head.rstrip(b"\r\n").rpartition(b"\n")
+        if window_start and not newline:
+            return None
+        try:
+            payload = _loads(last)
+        except ValueError:
+            return None
+        if not isinstance(payload, dict) or payload.get("entry_id") != cached.entries[-1].entry_id:
+            return None
+        self._logger.debug(
+            "Loading appended entries",
+            extra={"event": "entries_load_tail", "offset": offset, "bytes": len(appended)},
+        )
+        lines = [line for line in appended.splitlines() if line.strip()]
+        return _EntriesSnapshot(key=key, entries=cached.entries + self._deserialize_entries(lines))
+
+    def _load_range_index(self) -> _RangeIndex:
+        snapshot = self._snapshot()
+        with self._cache_lock:
+            if snapshot.index is None:
+                snapshot.index = _RangeIndex.build(snapshot.entries)
+            return snapshot.index
+
+    def _store_cache(self, entries: list[Entry], locked_file: IO[bytes]) -> None:
+        """Adopt the entries just written through ``locked_file`` as the cached log contents."""
+        self._adopt_cache(entries, _stat_key(os.fstat(locked_file.fileno())))
+
+    def _adopt_cache(self, entries: list[Entry], key: tuple[int, int]) -> None:
+        with self._cache_lock:
+            self._cache = _EntriesSnapshot(key=key, entries=entries)
+
+    def _extend_cache(self, before: tuple[int, int], entries: Sequence[Entry], locked_file: IO[bytes]) -> None:
+        """Append freshly written entries to the cache if it matched the file before the write."""
+        key = _stat_key(os.fstat(locked_file.fileno()))
+        with self._cache_lock:
+            cached = self._cache
+            if cached is None or cached.key != before:
+                self._cache = None
+                return
+            cached.entries.extend(entries)
+            cached.key = key
+            cached.index = None
+            if cached.task_counts is not None:
+                cached.task_counts.update(entry.task for entry in entries)
+            if cached.last is not None:
+                # The previous latest entry stays first, so ties resolve as a full max() would.
+                cached.last = max([cached.last, *entries], key=_recency)
+
+    def _patch_cache(
+        self,
+        before: tuple[int, int],
+        after: tuple[int, int],
+        transform: Callable[[Entry], Entry],
+        transform_counts: Callable[[Counter[str]], Counter[str]] | None = None,
+    ) -> None:
+        """Apply a rewrite to the cached entries if the cache matched the file before it."""
+        with self._cache_lock:
+            cached = self._cache
+            if cached is None or cached.key != before:
+                self._cache = None
+                return
+            counts = cached.task_counts
+            self._cache = _EntriesSnapshot(
+                key=after,
+                entries=[transform(entry) for entry in cached.entries],
+                task_counts=transform_counts(counts) if counts is not None and transform_counts else None,
+            )
+
+    def _read_lines(self) -> tuple[tuple[int, int] | None, list[bytes]]:
+        key, data = self._read_bytes(0)
+        # One read plus a C-level split instead of decoding through TextIOWrapper line by line.
+        return key, [line for line in data.splitlines() if line.strip()]
+
+    def _read_bytes(self, offset: int) -> tuple[tuple[int, int] | None, bytes]:
+        """Read the log from ``offset`` together with the stat key of the bytes read."""
+        try:
+            with self._locked("rb", portalocker.LockFlags.SHARED) as locked_file:
+                key = _stat_key(os.fstat(locked_file.fileno()))
+                locked_file.seek(offset)
+                return key, locked_file.read()
         except FileNotFoundError:
             self._ensure_file()
-            return []
+            return None, b""
         except Exception as exc:  # pragma: no cover - defensive
             self._logger.exception("Failed reading entries file")
             raise PersistenceError("Unable to read entries") from exc
 
-    def _deserialize_entries(self, lines: Iterable[str]) -> list[Entry]:
+    def _deserialize_entries(self, lines: Iterable[str | bytes]) -> list[Entry]:
         entries: list[Entry] = []
         for index, line in enumerate(lines, start=1):
             try:
-                payload = json.loads(line)
+                payload = _loads(line)
                 entries.append(Entry.from_json_dict(payload))
             except Exception as exc:  # pragma: no cover - resilience
                 self._logger.exception(
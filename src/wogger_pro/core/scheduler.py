@@ -27,6 +27,8 @@ class PromptScheduler(QObject):
         self._timer.timeout.connect(self._on_timeout)
         self._cron_iter = self._build_croniter(cron_expression, datetime.now())
         self._next_fire: Optional[datetime] = None
+        # Fire time preceding ``_next_fire``; known once the schedule has advanced at least once.
+        self._prev_fire: Optional[datetime] = None
 
     # ------------------------------------------------------------------
     def start(self) -> None:
@@ -43,6 +45,7 @@ class PromptScheduler(QObject):
             self._logger.info("Prompt scheduler stopping", extra={"event": "scheduler_stop"})
             self._timer.stop()
         self._next_fire = None
+        self._prev_fire = None
 
     def update_cron(self, cron_expression: str) -> None:
         if cron_expression == self._cron_expression:
@@ -58,6 +61,7 @@ class PromptScheduler(QObject):
         self._cron_expression = cron_expression
         self._cron_iter = self._build_croniter(cron_expression, datetime.now())
         self._next_fire = None
+        self._prev_fire = None
         self.schedule_changed.emit(cron_expression)
         if self._timer.isActive():
             self._timer.stop()
@@ -77,19 +81,21 @@ class PromptScheduler(QObject):
         due_segments: list[ScheduledSegment] = []
 
         while self._next_fire and self._next_fire <= now:
-            segment = self._build_segment_for_fire(self._next_fire)
+            segment = self._build_segment_for_fire(self._next_fire, self._prev_fire)
             due_segments.append(segment)
-            self._logger.info(
-                "Scheduled segment ready",
-                extra={
-                    "event": "segment_ready",
-                    "segment_id": segment.segment_id,
-                    "start": segment.segment_start.isoformat(),
-                    "end": segment.segment_end.isoformat(),
-                    "minutes": segment.minutes,
-                },
-            )
+            if self._logger.isEnabledFor(logging.INFO):
+                self._logger.info(
+                    "Scheduled segment ready",
+                    extra={
+                        "event": "segment_ready",
+                        "segment_id": segment.segment_id,
+                        "start": segment.segment_start.isoformat(),
+                        "end": segment.segment_end.isoformat(),
+                        "minutes": segment.minutes,
+                    },
+                )
             self.segment_ready.emit(segment)
+            self._prev_fire = self._next_fire
             self._next_fire = self._cron_iter.get_next(datetime)
 
         if not due_segments:
@@ -114,18 +120,21 @@ class PromptScheduler(QObject):
         else:
             delay_ms = int(delay.total_seconds() * 1000)
         self._timer.start(delay_ms)
-        self._logger.debug(
-            "Scheduler %s next fire",
-            "initialized" if initial else "updated",
-            extra={
-                "event": "scheduler_next_fire",
-                "fire_at": self._next_fire.isoformat(),
-                "delay_ms": delay_ms,
-            },
-        )
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                "Scheduler %s next fire",
+                "initialized" if initial else "updated",
+                extra={
+                    "event": "scheduler_next_fire",
+                    "fire_at": self._next_fire.isoformat(),
+                    "delay_ms": delay_ms,
+                },
+            )
 
-    def _build_segment_for_fire(self, fire_time: datetime) -> ScheduledSegment:
-        previous_fire = croniter(self._cron_expression, fire_time).get_prev(datetime)
+    def _build_segment_for_fire(self, fire_time: datetime, previous_fire: Optional[datetime]) -> ScheduledSegment:
+        if previous_fire is None:
+            # Only the first fire after (re)starting has to ask croniter to look backwards.
+            previous_fire = croniter(self._cron_expression, fire_time).get_prev(datetime)
         minutes = max(1, int((fire_time - previous_fire).total_seconds() // 60))
         return ScheduledSegment(segment_start=previous_fire, segment_end=fire_time, minutes=minutes)
 
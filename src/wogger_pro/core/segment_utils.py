@@ -24,12 +24,13 @@ def entry_ranges(entries: Iterable[Entry]) -> list[TimeRange]:
 
 
 def compute_conflicts(requested: TimeRange, entries: Sequence[Entry]) -> list[SegmentConflict]:
-    conflicts: list[SegmentConflict] = []
-    for entry in entries:
-        entry_range = entry.as_range()
-        if requested.overlaps(entry_range):
-            conflicts.append(SegmentConflict(requested=requested, conflicting=entry_range, entry=entry))
-    return conflicts
+    # Compare the raw fields so a TimeRange is only built for entries that actually conflict.
+    requested_start, requested_end = requested.start, requested.end
+    return [
+        SegmentConflict(requested=requested, conflicting=entry.as_range(), entry=entry)
+        for entry in entries
+        if entry.segment_start < requested_end and entry.segment_end > requested_start
+    ]
 
 
 def compute_remainders_for_segment(segment: ScheduledSegment, entries: Sequence[Entry]) -> list[TimeRange]:
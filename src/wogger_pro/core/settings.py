@@ -7,11 +7,17 @@ import logging
 import os
 from dataclasses import asdict, dataclass, field
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable
 
 from croniter import croniter
 
+try:  # pragma: no cover - optional accelerator
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
 from .exceptions import SettingsError
 from .paths import (
     current_app_data_dir,
@@ -105,8 +111,8 @@ class SettingsManager:
             return Settings()
 
         try:
-            with self._path.open("r", encoding="utf-8") as infile:
-                payload = json.load(infile)
+            with self._path.open("rb") as infile:
+                payload = _load_settings(infile.read())
         except json.JSONDecodeError as exc:
             self._logger.exception(
                 "Invalid JSON in settings file; falling back to defaults",
@@ -177,8 +183,8 @@ class SettingsManager:
 
         temp_path = self._path.with_suffix(".tmp")
         try:
-            with temp_path.open("w", encoding="utf-8") as outfile:
-                json.dump(settings.to_dict(), outfile, indent=2)
+            with temp_path.open("wb") as outfile:
+                outfile.write(_dumps_settings(settings.to_dict()))
                 outfile.flush()
                 os.fsync(outfile.fileno())
             temp_path.replace(self._path)
@@ -193,7 +199,23 @@ class SettingsManager:
         return updated
 
 
+def _load_settings(data: bytes) -> Any:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so load() handles both the same way.
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_settings(payload: dict[str, Any]) -> bytes:
+    # Same two-space layout either way, so the file stays hand-editable whichever encoder wrote it.
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
+@lru_cache(maxsize=64)
 def _validate_cron(expression: str) -> None:
+    # Only successful validations are cached; an invalid expression raises again on every call.
     try:
         croniter(expression)
     except Exception as exc:  # pragma: no cover - croniter details
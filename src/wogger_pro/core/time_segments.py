@@ -1,6 +1,8 @@
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Iterable, Sequence
+from itertools import accumulate, pairwise
+from typing import Iterable, Iterator, Sequence
 
 
 @dataclass(frozen=True, slots=True)
@@ -41,54 +43,228 @@ def sort_ranges(ranges: Iterable[TimeRange]) -> list[TimeRange]:
     return sorted(ranges, key=lambda rng: (rng.start, rng.end))
 
 
-def coalesce(ranges: Iterable[TimeRange]) -> list[TimeRange]:
-    ordered = sort_ranges(ranges)
-    if not ordered:
-        return []
-
-    merged: list[TimeRange] = [ordered[0]]
-    for current in ordered[1:]:
-        last = merged[-1]
-        if last.overlaps(current) or last.touches(current):
-            merged[-1] = last.merge(current)
+# The sweeps below work on parallel start/end lists and only build TimeRange objects for their
+# results, instead of allocating (and re-validating) a merged TimeRange per step.
+def _split(pairs: list[tuple[datetime, datetime]]) -> tuple[list[datetime], list[datetime]]:
+    pairs.sort()
+    return [start for start, _ in pairs], [end for _, end in pairs]
+
+
+def _merge_spans(starts: list[datetime], ends: list[datetime]) -> tuple[list[datetime], list[datetime]]:
+    """Merge sorted spans that overlap or touch, in place; returns the same (truncated) lists."""
+    # ``kept`` is the write cursor: spans before it are final, ``ends[kept]`` is still growing.
+    kept = 0
+    last_end = ends[0]
+    for index in range(1, len(starts)):
+        start = starts[index]
+        end = ends[index]
+        if start <= last_end:
+            if end > last_end:
+                last_end = ends[kept] = end
         else:
-            merged.append(current)
-    return merged
+            kept += 1
+            starts[kept] = start
+            last_end = ends[kept] = end
+    del starts[kept + 1 :], ends[kept + 1 :]
+    return starts, ends
+
+
+def _to_ranges(starts: Iterable[datetime], ends: Iterable[datetime]) -> list[TimeRange]:
+    return [TimeRange(start=start, end=end) for start, end in zip(starts, ends)]
+
+
+@dataclass(slots=True)
+class _SubtractorIndex:
+    """Sorted, disjoint subtractor spans as parallel lists, built once and queried per base.
+
+    Because the spans are disjoint, ``ends`` is already its own running maximum, so it can be
+    bisected directly without a separate max-end prefix.
+    """
+
+    starts: list[datetime]
+    ends: list[datetime]
+
+    @classmethod
+    def build(cls, subtractors: Iterable[TimeRange]) -> "_SubtractorIndex":
+        pairs = [(rng.start, rng.end) for rng in subtractors]
+        if not pairs:
+            return cls(starts=[], ends=[])
+        return cls(*_merge_spans(*_split(pairs)))
+
+    def query(self, start: datetime, end: datetime) -> tuple[int, int]:
+        """Slice bounds of the spans overlapping ``[start, end)``: O(log n) regardless of size."""
+        first = bisect_right(self.ends, start)
+        return first, bisect_left(self.starts, end, lo=first)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+
+def _emit_remainders(remainders: list[TimeRange], base: TimeRange, index: _SubtractorIndex) -> None:
+    """Append the parts of ``base`` not covered by the spans in ``index``."""
+    base_start, base_end = base.start, base.end
+    first, stop = index.query(base_start, base_end)
+    if first == stop:
+        remainders.append(base)
+        return
+
+    cursor = base_start
+    for start, end in zip(index.starts[first:stop], index.ends[first:stop]):
+        if start > cursor:
+            remainders.append(TimeRange(start=cursor, end=start))
+        cursor = end
+
+    if cursor < base_end:
+        remainders.append(TimeRange(start=cursor, end=base_end))
+
+
+def coalesce(ranges: Iterable[TimeRange]) -> list[TimeRange]:
+    ordered = list(ranges)
+    # Input that is already sorted and disjoint (e.g. a previous coalesce result) is returned as is.
+    if all(previous.end < current.start for previous, current in pairwise(ordered)):
+        return ordered
+    return _to_ranges(*_merge_spans(*_split([(rng.start, rng.end) for rng in ordered])))
+
+
+def _range_start(rng: TimeRange) -> datetime:
+    return rng.start
+
 
+def _range_end(rng: TimeRange) -> datetime:
+    return rng.end
 
-def subtract(base: TimeRange, subtractors: Sequence[TimeRange]) -> list[TimeRange]:
+
+def subtract(
+    base: TimeRange,
+    subtractors: Sequence[TimeRange],
+    *,
+    sorted_disjoint: bool = False,
+) -> list[TimeRange]:
+    """Return the parts of ``base`` not covered by ``subtractors``, in ascending order.
+
+    Pass ``sorted_disjoint=True`` when ``subtractors`` are already sorted and non-overlapping (for
+    example a :func:`coalesce` result): they are then bisected directly, skipping the clip, sort
+    and merge passes over the whole sequence.
+    """
     if not subtractors:
         return [base]
 
-    relevant: list[TimeRange] = []
-    for rng in subtractors:
-        intersection = base.intersect(rng)
-        if intersection is not None:
-            relevant.append(intersection)
+    remainders: list[TimeRange] = []
+    if sorted_disjoint:
+        first = bisect_right(subtractors, base.start, key=_range_end)
+        stop = bisect_left(subtractors, base.end, lo=first, key=_range_start)
+        candidates = subtractors[first:stop]
+        # Spans reaching past either edge of ``base`` are handled by the gap emission itself.
+        index = _SubtractorIndex(starts=[rng.start for rng in candidates], ends=[rng.end for rng in candidates])
+        _emit_remainders(remainders, base, index)
+        return remainders
 
+    base_start, base_end = base.start, base.end
+    # Clip every overlapping subtractor to ``base`` as plain pairs, without building intersections.
+    relevant = [
+        (
+            rng.start if rng.start > base_start else base_start,
+            rng.end if rng.end < base_end else base_end,
+        )
+        for rng in subtractors
+        if rng.start < base_end and rng.end > base_start
+    ]
     if not relevant:
         return [base]
 
-    merged = coalesce(relevant)
-    remainders: list[TimeRange] = []
-    cursor = base.start
+    if all(previous[1] < current[0] for previous, current in pairwise(relevant)):
+        index = _SubtractorIndex(starts=[start for start, _ in relevant], ends=[end for _, end in relevant])
+    else:
+        index = _SubtractorIndex(*_merge_spans(*_split(relevant)))
+    _emit_remainders(remainders, base, index)
+    return remainders
 
-    for rng in merged:
-        if rng.start > cursor:
-            remainders.append(TimeRange(start=cursor, end=rng.start))
-        cursor = max(cursor, rng.end)
 
-    if cursor < base.end:
-        remainders.append(TimeRange(start=cursor, end=base.end))
-
-    return remainders
+def _cut_bases(bases: list[TimeRange], index: _SubtractorIndex) -> bytearray:
+    """Flag the sorted ``bases`` that any of the disjoint spans overlaps, bisecting once per span."""
+    base_starts = [base.start for base in bases]
+    # Running maximum of base ends: monotone even when bases overlap, so it can be bisected.
+    reach = list(accumulate((base.end for base in bases), max))
+    cut = bytearray(len(bases))
+    for start, end in zip(index.starts, index.ends):
+        for position in range(bisect_right(reach, start), bisect_left(base_starts, end)):
+            if bases[position].end > start:
+                cut[position] = 1
+    return cut
 
 
 def subtract_many(base_ranges: Sequence[TimeRange], subtractors: Sequence[TimeRange]) -> list[TimeRange]:
+    bases = sort_ranges(base_ranges)
+    if not subtractors:
+        return bases
+
+    # Coalesce the subtractors into one index; each base then bisects to the few spans that can cut it.
+    index = _SubtractorIndex.build(subtractors)
+    # With fewer spans than bases, iterate the spans instead and let uncut bases pass straight through.
+    cut = _cut_bases(bases, index) if len(index) < len(bases) else None
     remainders: list[TimeRange] = []
-    for base in base_ranges:
-        remainders.extend(subtract(base, subtractors))
-    return sort_ranges(remainders)
+    reached: datetime | None = None
+    ordered = True
+
+    for position, base in enumerate(bases):
+        if cut is None or cut[position]:
+            _emit_remainders(remainders, base, index)
+        else:
+            remainders.append(base)
+        base_start, base_end = base.start, base.end
+        if reached is not None and base_start < reached:
+            ordered = False
+        if reached is None or base_end > reached:
+            reached = base_end
+
+    # Remainders come out sorted unless bases overlap each other.
+    return remainders if ordered else sort_ranges(remainders)
+
+
+class IntervalSet:
+    """Sorted, disjoint ranges that absorb overlapping or touching ranges as they are added.
+
+    Each ``add`` bisects to the neighbouring spans and merges only those, so building the set one
+    range at a time stays O(log n) per insert plus a list splice, instead of re-coalescing.
+    """
+
+    __slots__ = ("_starts", "_ends")
+
+    def __init__(self, ranges: Iterable[TimeRange] = ()) -> None:
+        pairs = [(rng.start, rng.end) for rng in ranges]
+        self._starts: list[datetime] = []
+        self._ends: list[datetime] = []
+        if pairs:
+            self._starts, self._ends = _merge_spans(*_split(pairs))
+
+    def add(self, rng: TimeRange) -> None:
+        start, end = rng.start, rng.end
+        starts, ends = self._starts, self._ends
+        # Spans ending at or after ``start`` and starting at or before ``end`` merge with ``rng``.
+        first = bisect_left(ends, start)
+        stop = bisect_right(starts, end, lo=first)
+        if first < stop:
+            if starts[first] < start:
+                start = starts[first]
+            if ends[stop - 1] > end:
+                end = ends[stop - 1]
+        starts[first:stop] = [start]
+        ends[first:stop] = [end]
+
+    def subtract(self, rng: TimeRange) -> list[TimeRange]:
+        """Return the parts of ``rng`` the set does not cover, bisecting to the spans that cut it."""
+        remainders: list[TimeRange] = []
+        _emit_remainders(remainders, rng, _SubtractorIndex(starts=self._starts, ends=self._ends))
+        return remainders
+
+    def ranges(self) -> list[TimeRange]:
+        return _to_ranges(self._starts, self._ends)
+
+    def __iter__(self) -> Iterator[TimeRange]:
+        return iter(self.ranges())
+
+    def __len__(self) -> int:
+        return len(self._starts)
 
 
 def minutes_between(start: datetime, end: datetime) -> int:
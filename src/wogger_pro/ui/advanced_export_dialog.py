@@ -6,7 +6,7 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Sequence
 
 from PySide6.QtCore import QDateTime
 from PySide6.QtWidgets import (
@@ -37,6 +37,26 @@ from ..core.paths import default_downloads_dir
 
 LOGGER = logging.getLogger("wogger.ui.export.advanced")
 
+_DEFAULT_NAMES = {
+    ExportFormat.CSV: "advanced-export.csv",
+    ExportFormat.JSONL: "advanced-export.jsonl",
+    ExportFormat.JSON: "advanced-export.json",
+    ExportFormat.EXCEL: "advanced-export.xlsx",
+}
+_FILTERS = {
+    ExportFormat.CSV: "CSV Files (*.csv)",
+    ExportFormat.JSONL: "JSON Lines (*.jsonl)",
+    ExportFormat.JSON: "JSON Files (*.json)",
+    ExportFormat.EXCEL: "Excel Workbook (*.xlsx)",
+}
+_FILTER_STRING = ";;".join(_FILTERS.values())
+_EXTENSIONS = {
+    ExportFormat.CSV: ".csv",
+    ExportFormat.JSONL: ".jsonl",
+    ExportFormat.JSON: ".json",
+    ExportFormat.EXCEL: ".xlsx",
+}
+
 
 @dataclass
 class _ExportRange:
@@ -47,16 +67,21 @@ class _ExportRange:
 class AdvancedExportDialog(QDialog):
     def __init__(
         self,
-        entries: Iterable[Entry],
+        span: tuple[datetime, datetime] | None,
+        load_entries: Callable[[datetime, datetime], Sequence[Entry]],
         parent: QWidget | None = None,
     ) -> None:
+        """``span`` is the (earliest start, latest end) of the available entries, None when empty.
+
+        ``load_entries(start, end)`` fetches the entries overlapping the chosen window on export.
+        """
         super().__init__(parent)
         self.setWindowTitle("Advanced Export")
         self.setModal(True)
         self.resize(420, 320)
 
-        self._entries = sorted(entries, key=lambda entry: entry.segment_start)
-        self._range = self._compute_range(self._entries)
+        self._range = _ExportRange(*span) if span is not None else None
+        self._load_entries = load_entries
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -150,7 +175,7 @@ class AdvancedExportDialog(QDialog):
         return box
 
     def _update_controls_enabled(self) -> None:
-        has_entries = bool(self._entries)
+        has_entries = self._range is not None
         for widget in (self._start_edit, self._end_edit, self._type_combo, self._group_combo, self._format_combo, self._all_button):
             widget.setEnabled(has_entries)
         self._button_box.button(QDialogButtonBox.Ok).setEnabled(has_entries)
@@ -164,11 +189,16 @@ class AdvancedExportDialog(QDialog):
         if self._range:
             default_start = QDateTime(self._range.start)
             default_end = QDateTime(self._range.end)
+        # Set both editors silently, then apply the end constraint once instead of per change signal.
+        self._start_edit.blockSignals(True)
+        self._end_edit.blockSignals(True)
         self._start_edit.setDateTime(default_start)
         self._end_edit.setDateTime(default_end)
         self._start_edit.setMinimumDateTime(default_start.addYears(-25))
-        self._end_edit.setMinimumDateTime(default_start)
         self._end_edit.setMaximumDateTime(QDateTime.currentDateTime().addYears(25))
+        self._start_edit.blockSignals(False)
+        self._end_edit.blockSignals(False)
+        self._on_start_changed(self._start_edit.dateTime())
 
     def _on_all_clicked(self) -> None:
         if not self._range:
@@ -185,7 +215,7 @@ class AdvancedExportDialog(QDialog):
 
     def _on_export(self) -> None:
         self._status_label.clear()
-        if not self._entries:
+        if self._range is None:
             self.reject()
             return
 
@@ -205,7 +235,7 @@ class AdvancedExportDialog(QDialog):
         )
 
         try:
-            table = generate_export_table(self._entries, options)
+            table = generate_export_table(self._load_entries(start, end), options)
         except Exception as exc:
             LOGGER.exception("Failed to generate export table")
             QMessageBox.critical(self, "Export failed", str(exc))
@@ -251,47 +281,21 @@ class AdvancedExportDialog(QDialog):
         self.accept()
 
     def _prompt_for_path(self, fmt: ExportFormat) -> Path | None:
-        default_name = {
-            ExportFormat.CSV: "advanced-export.csv",
-            ExportFormat.JSONL: "advanced-export.jsonl",
-            ExportFormat.JSON: "advanced-export.json",
-            ExportFormat.EXCEL: "advanced-export.xlsx",
-        }[fmt]
-        filters = {
-            ExportFormat.CSV: "CSV Files (*.csv)",
-            ExportFormat.JSONL: "JSON Lines (*.jsonl)",
-            ExportFormat.JSON: "JSON Files (*.json)",
-            ExportFormat.EXCEL: "Excel Workbook (*.xlsx)",
-        }
-        filter_string = ";;".join(filters.values())
-        suggestion = Path(default_downloads_dir()) / default_name
+        suggestion = Path(default_downloads_dir()) / _DEFAULT_NAMES[fmt]
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Save export",
             str(suggestion),
-            filter_string,
-            filters[fmt],
+            _FILTER_STRING,
+            _FILTERS[fmt],
         )
         if not file_path:
             return None
         target = Path(file_path).expanduser()
         if target.suffix == "":
-            extension = {
-                ExportFormat.CSV: ".csv",
-                ExportFormat.JSONL: ".jsonl",
-                ExportFormat.JSON: ".json",
-                ExportFormat.EXCEL: ".xlsx",
-            }[fmt]
-            target = target.with_suffix(extension)
+            target = target.with_suffix(_EXTENSIONS[fmt])
         return target
 
-    @staticmethod
-    def _compute_range(entries: Iterable[Entry]) -> _ExportRange | None:
-        entries_list = list(entries)
-        if not entries_list:
-            return None
-        return _ExportRange(start=entries_list[0].segment_start, end=max(entry.segment_end for entry in entries_list))
-
 
 def _to_datetime(value: QDateTime) -> datetime:
     if hasattr(value, "toPython"):
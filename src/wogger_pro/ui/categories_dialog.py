@@ -3,26 +3,21 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QModelIndex, QObject, QRunnable, QThreadPool, QTimer, Signal
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QButtonGroup,
     QDialog,
     QDialogButtonBox,
     QHBoxLayout,
-    QInputDialog,
     QLabel,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QMessageBox,
-    QPlainTextEdit,
     QPushButton,
     QStackedWidget,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QVBoxLayout,
     QWidget,
 )
@@ -30,17 +25,52 @@ from PySide6.QtWidgets import (
 from ..core.categories import CategoryManager
 from ..core.exceptions import PersistenceError
 from ..core.repository import EntriesRepository
+from .categories_model import (
+    CATEGORY_WORDS,
+    CategoryListModel,
+    CategoryRow,
+    CategoryTreeModel,
+    count_phrase,
+)
 from .category_picker import CATEGORY_PATH_SEPARATOR
 from .icons import app_icon
 
+if TYPE_CHECKING:  # pragma: no cover - annotations only; the prompts import it when first used
+    from PySide6.QtWidgets import QInputDialog
+
 LOGGER = logging.getLogger("wogger.ui.categories")
 
+_LOADING_COUNTS_TEXT = "Loading entry counts…"
+
+
+def _read_category_counts(repository: EntriesRepository) -> dict[str, tuple[str, int]] | None:
+    counts: dict[str, tuple[str, int]] = {}
+    try:
+        for name, count in repository.list_categories_with_counts():
+            normalized = (name or "").strip()
+            if not normalized:
+                continue
+            counts[normalized.lower()] = (normalized, count)
+    except Exception:  # pragma: no cover - defensive
+        LOGGER.exception("Unable to load category counts")
+        return None
+    return counts
 
-@dataclass(slots=True)
-class CategoryRow:
-    name: str
-    count: int
-    managed: bool
+
+class _CountsSignals(QObject):
+    loaded = Signal(object)
+
+
+class _CountsLoader(QRunnable):
+    """Reads entry counts on a pool thread; the result is queued back to the dialog."""
+
+    def __init__(self, repository: EntriesRepository) -> None:
+        super().__init__()
+        self.signals = _CountsSignals()
+        self._repository = repository
+
+    def run(self) -> None:
+        self.signals.loaded.emit(_read_category_counts(self._repository))
 
 
 class CategoriesDialog(QDialog):
@@ -61,13 +91,40 @@ class CategoriesDialog(QDialog):
         self._category_manager = category_manager
         self._repository = repository
         self._rows: list[CategoryRow] = []
+        self._rows_by_key: dict[str, CategoryRow] = {}
+        # Managed names in stored order, and each one's position in that order.
+        self._managed_order: list[str] = []
+        self._managed_index: dict[str, int] = {}
+        # Entry counts per category, reloaded only after an action that changes entries. The
+        # first load runs in the background so the dialog opens without waiting on it.
+        self._counts_cache: dict[str, tuple[str, int]] = {}
+        self._counts_dirty = False
+        self._counts_pending = False
+        self._counts_signals: _CountsSignals | None = None
+        # Key paths of expanded tree nodes, so nodes removed and re-added by a refresh reopen.
+        self._expanded_keys: set[str] = set()
+        # Only the visible view is brought up to date on a refresh; the other catches up when
+        # it is shown. Top-level tree nodes are expanded the first time the tree has rows.
+        self._flat_dirty = True
+        self._tree_dirty = True
+        self._tree_seeded = False
         self._entries_updated_callback = entries_updated
+        # Built on first use and shared by the add and rename prompts.
+        self._name_input_dialog: QInputDialog | None = None
 
         self._build_ui()
         self._refresh_list()
+        self._load_counts_in_background()
 
     # ------------------------------------------------------------------
     def _build_ui(self) -> None:
+        # Selection changes in both views, refreshes and view switches all request a button
+        # update; a zero-interval single shot folds them into one pass per event-loop turn.
+        self._sync_timer = QTimer(self)
+        self._sync_timer.setSingleShot(True)
+        self._sync_timer.setInterval(0)
+        self._sync_timer.timeout.connect(self._apply_button_states)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(16, 16, 16, 16)
         layout.setSpacing(12)
@@ -102,17 +159,33 @@ class CategoriesDialog(QDialog):
         self._view_group.addButton(self._tree_button, 1)
         self._view_group.buttonToggled.connect(self._on_view_button_toggled)
 
-        self._list = QListWidget(self)
-        self._list.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
-        self._list.itemSelectionChanged.connect(self._sync_button_states)
-        self._list.itemDoubleClicked.connect(lambda _item: self._on_rename_clicked())
-
-        self._tree = QTreeWidget(self)
+        # Both views are backed by models built from the same rows; a refresh only reports the
+        # rows that were inserted, removed or changed, so unaffected rows keep their state.
+        self._list_model = CategoryListModel(self)
+        self._list = QListView(self)
+        self._list.setModel(self._list_model)
+        self._list_model.set_base_font(self._list.font())
+        self._list.setUniformItemSizes(True)
+        self._list.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self._list.selectionModel().selectionChanged.connect(lambda *_: self._sync_button_states())
+        self._list.doubleClicked.connect(lambda _index: self._on_rename_clicked())
+
+        self._tree_model = CategoryTreeModel(self)
+        self._tree = QTreeView(self)
+        self._tree.setModel(self._tree_model)
+        self._tree_model.set_base_font(self._tree.font())
         self._tree.setHeaderHidden(True)
         self._tree.setUniformRowHeights(True)
         self._tree.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
-        self._tree.itemSelectionChanged.connect(self._sync_button_states)
-        self._tree.itemDoubleClicked.connect(self._on_tree_item_double_clicked)
+        self._tree.selectionModel().selectionChanged.connect(lambda *_: self._sync_button_states())
+        self._tree.doubleClicked.connect(self._on_tree_item_double_clicked)
+        self._tree_model.rowsInserted.connect(self._on_tree_rows_inserted)
+        self._tree.expanded.connect(
+            lambda index: self._expanded_keys.add(self._tree_model.key_path(index))
+        )
+        self._tree.collapsed.connect(
+            lambda index: self._expanded_keys.discard(self._tree_model.key_path(index))
+        )
 
         self._stack = QStackedWidget(self)
         self._stack.addWidget(self._list)
@@ -180,6 +253,8 @@ class CategoriesDialog(QDialog):
         self._tree_button.setChecked(tree)
         self._view_group.blockSignals(False)
         self._stack.setCurrentIndex(1 if tree else 0)
+        if (self._tree_dirty if tree else self._flat_dirty):
+            self._populate_view(tree=tree)
         if current is not None:
             self._select_category(current.name)
         else:
@@ -192,217 +267,178 @@ class CategoriesDialog(QDialog):
     # ------------------------------------------------------------------
     def _refresh_list(self) -> None:
         previous = self._current_row()
-        previous_name = previous.name if previous else None
 
         counts = self._gather_counts()
         managed_categories = self._category_manager.list_categories()
 
         rows: list[CategoryRow] = []
+        managed_keys: set[str] = set()
         for name in managed_categories:
-            lower = name.lower()
-            stored = counts.pop(lower, (name, 0))
-            count = stored[1]
-            rows.append(CategoryRow(name=name, count=count, managed=True))
-
-        unmanaged = [
-            CategoryRow(name=stored[0], count=stored[1], managed=False)
-            for stored in counts.values()
-        ]
-        unmanaged.sort(key=lambda row: row.name.lower())
-        rows.extend(unmanaged)
+            key = name.lower()
+            managed_keys.add(key)
+            stored = counts.get(key)
+            rows.append(self._reuse_row(name, stored[1] if stored else 0, managed=True))
+
+        unmanaged = sorted(
+            (stored for key, stored in counts.items() if key not in managed_keys),
+            key=lambda stored: stored[0].casefold(),
+        )
+        rows.extend(self._reuse_row(name, count, managed=False) for name, count in unmanaged)
 
         self._rows = rows
-
-        self._populate_flat_view()
-        self._populate_tree_view()
-
-        if previous_name is not None:
-            self._select_category(previous_name)
-        else:
-            self._clear_selection()
+        self._rows_by_key = {row.key: row for row in rows}
+        self._managed_order = [row.name for row in rows if row.managed]
+        self._managed_index = {
+            row.key: position for position, row in enumerate(row for row in rows if row.managed)
+        }
+
+        self._flat_dirty = True
+        self._tree_dirty = True
+        self._populate_view(tree=self._using_tree_view())
+
+        # Rows that survive the refresh keep their selection in both views. A removed row's
+        # selection is cleared, and a moved row is reinserted, so it has to be selected again.
+        if previous is not None:
+            current = self._current_row()
+            if previous.key not in self._rows_by_key:
+                self._clear_selection()
+            elif current is None or current.key != previous.key:
+                self._select_category(previous.name)
 
         self._sync_button_states()
 
-    def _populate_flat_view(self) -> None:
-        self._list.blockSignals(True)
-        self._list.clear()
-
-        if not self._rows:
-            placeholder = QListWidgetItem("No categories yet")
-            placeholder.setFlags(Qt.ItemFlag.NoItemFlags)
-            self._list.addItem(placeholder)
-            self._list.blockSignals(False)
-            return
-
-        for row in self._rows:
-            label = self._format_row_label(row)
-            item = QListWidgetItem(label)
-            item.setData(Qt.ItemDataRole.UserRole, row)
-            if not row.managed:
-                font = item.font()
-                font.setItalic(True)
-                item.setFont(font)
-                item.setToolTip(
-                    "Category exists in entries but is not saved. Rename or delete to resolve."
-                )
+    def _populate_view(self, *, tree: bool) -> None:
+        view = self._tree if tree else self._list
+        # A bulk edit can insert or remove many rows; repaint once after the model settles.
+        view.setUpdatesEnabled(False)
+        try:
+            if tree:
+                self._tree_model.set_rows(self._rows)
             else:
-                item.setToolTip(row.name)
-            self._list.addItem(item)
-
-        self._list.blockSignals(False)
+                self._list_model.set_rows(self._rows)
+        finally:
+            view.setUpdatesEnabled(True)
+        if not tree:
+            self._flat_dirty = False
+            return
+        self._tree_dirty = False
+        if not self._tree_seeded and self._rows:
+            self._tree_seeded = True
+            self._expand_top_level()
+
+    def _reuse_row(self, name: str, count: int, *, managed: bool) -> CategoryRow:
+        # Surviving rows are updated in place; only new or re-cased names get a fresh row.
+        row = self._rows_by_key.get(name.lower())
+        if row is None or row.name != name:
+            return CategoryRow(name=name, count=count, managed=managed)
+        row.update(count, managed)
+        return row
+
+    def _on_tree_rows_inserted(self, parent: QModelIndex, first: int, last: int) -> None:
+        if not self._expanded_keys:
+            return
+        model = self._tree_model
+        parent_path = model.key_path(parent)
+        pending = [(model.index(row, 0, parent), parent_path) for row in range(first, last + 1)]
+        while pending:
+            index, parent_path = pending.pop()
+            path = model.child_key_path(parent_path, index)
+            if path in self._expanded_keys:
+                self._tree.expand(index)
+            pending.extend((model.index(row, 0, index), path) for row in range(model.rowCount(index)))
 
-    def _populate_tree_view(self) -> None:
-        self._tree.blockSignals(True)
-        self._tree.clear()
+    def _gather_counts(self) -> dict[str, tuple[str, int]]:
+        if not self._counts_dirty:
+            return self._counts_cache
+        # A synchronous load supersedes any background load still in flight.
+        self._counts_pending = False
+        counts = _read_category_counts(self._repository)
+        if counts is None:
+            return {}
+        self._counts_cache = counts
+        self._counts_dirty = False
+        return counts
 
-        if not self._rows:
-            placeholder = QTreeWidgetItem(["No categories yet"])
-            placeholder.setFlags(Qt.ItemFlag.NoItemFlags)
-            self._tree.addTopLevelItem(placeholder)
-            self._tree.blockSignals(False)
+    def _load_counts_in_background(self) -> None:
+        loader = _CountsLoader(self._repository)
+        loader.signals.loaded.connect(self._on_counts_loaded)
+        self._counts_signals = loader.signals
+        self._counts_pending = True
+        self._status_label.setText(_LOADING_COUNTS_TEXT)
+        QThreadPool.globalInstance().start(loader)
+
+    def _on_counts_loaded(self, counts: dict[str, tuple[str, int]] | None) -> None:
+        self._counts_signals = None
+        if self._status_label.text() == _LOADING_COUNTS_TEXT:
+            self._status_label.setText("")
+        if not self._counts_pending:
+            return
+        self._counts_pending = False
+        if counts is None:
+            self._counts_dirty = True
             return
+        self._counts_cache = counts
+        # Unsaved categories only appear now; give them the default top-level expansion too.
+        self._tree_seeded = False
+        self._refresh_list()
 
-        node_map: dict[tuple[str, ...], QTreeWidgetItem] = {}
+    def _settle_counts(self) -> None:
+        """Load counts now if the background load is still running.
 
-        for row in self._rows:
-            parts = [segment.strip() for segment in row.name.split(CATEGORY_PATH_SEPARATOR)]
-            parts = [segment for segment in parts if segment]
-            if not parts:
-                parts = [row.name]
-
-            key_path: list[str] = []
-            parent_item: QTreeWidgetItem | None = None
-
-            for index, segment in enumerate(parts):
-                key_path.append(segment.lower())
-                key = tuple(key_path)
-                item = node_map.get(key)
-                created = False
-                if item is None:
-                    item = QTreeWidgetItem([segment])
-                    if parent_item is None:
-                        self._tree.addTopLevelItem(item)
-                    else:
-                        parent_item.addChild(item)
-                    node_map[key] = item
-                    created = True
-                if index < len(parts) - 1 and created:
-                    item.setFlags(Qt.ItemFlag.ItemIsEnabled)
-                if index == len(parts) - 1:
-                    display_name = segment
-                    item.setText(0, self._format_row_label(row, display_name=display_name))
-                    item.setData(0, Qt.ItemDataRole.UserRole, row)
-                    item.setFlags(Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)
-                    if not row.managed:
-                        font = item.font(0)
-                        font.setItalic(True)
-                        item.setFont(0, font)
-                        item.setToolTip(
-                            0,
-                            "Category exists in entries but is not saved. Rename or delete to resolve.",
-                        )
-                    else:
-                        item.setToolTip(0, row.name)
-                parent_item = item
-
-        self._tree.expandAll()
-        self._tree.blockSignals(False)
-
-    def _format_row_label(
-        self, row: CategoryRow, *, display_name: str | None = None
-    ) -> str:
-        name = display_name if display_name is not None else row.name
-        suffix = "entry" if row.count == 1 else "entries"
-        label = f"{name} ({row.count} {suffix})"
-        if not row.managed:
-            label += " [unsaved]"
-        return label
+        Confirmations quote the counts, and duplicate checks need the unsaved categories they add.
+        """
+        if self._counts_pending:
+            self._counts_dirty = True
+            self._refresh_list()
 
-    def _gather_counts(self) -> dict[str, tuple[str, int]]:
-        counts: dict[str, tuple[str, int]] = {}
-        try:
-            for name, count in self._repository.list_categories_with_counts():
-                normalized = (name or "").strip()
-                if not normalized:
-                    continue
-                lower = normalized.lower()
-                counts[lower] = (normalized, count)
-        except Exception:  # pragma: no cover - defensive
-            LOGGER.exception("Unable to load category counts")
-        return counts
+    def _expand_top_level(self) -> None:
+        for row in range(self._tree_model.rowCount()):
+            self._tree.expand(self._tree_model.index(row, 0))
 
     def _current_row(self) -> CategoryRow | None:
         if self._using_tree_view():
-            item = self._tree.currentItem()
-            if item is None:
-                return None
-            data = item.data(0, Qt.ItemDataRole.UserRole)
-            if isinstance(data, CategoryRow):
-                return data
-            return None
-
-        item = self._list.currentItem()
-        if item is None:
-            return None
-        data = item.data(Qt.ItemDataRole.UserRole)
-        if isinstance(data, CategoryRow):
-            return data
-        return None
+            return self._tree_model.row_at(self._tree.currentIndex())
+        return self._list_model.row_at(self._list.currentIndex())
 
     def _clear_selection(self) -> None:
-        self._list.blockSignals(True)
-        self._list.clearSelection()
-        self._list.blockSignals(False)
-
-        self._tree.blockSignals(True)
-        self._tree.clearSelection()
-        self._tree.blockSignals(False)
+        for view in (self._list, self._tree):
+            selection = view.selectionModel()
+            if not selection.hasSelection() and not selection.currentIndex().isValid():
+                continue
+            selection.blockSignals(True)
+            selection.clear()
+            selection.blockSignals(False)
 
     def _select_category(self, name: str) -> None:
-        lookup = name.lower()
-
-        self._list.blockSignals(True)
-        matched = False
-        for index in range(self._list.count()):
-            item = self._list.item(index)
-            data = item.data(Qt.ItemDataRole.UserRole)
-            if isinstance(data, CategoryRow) and data.name.lower() == lookup:
-                self._list.setCurrentRow(index)
-                matched = True
-                break
-        if not matched:
+        # A stale view is reselected by _set_view_mode once it has been brought up to date.
+        if not self._flat_dirty:
+            self._select_in_list(name)
+        if not self._tree_dirty:
+            self._select_in_tree(name)
+
+    def _select_in_list(self, name: str) -> None:
+        list_selection = self._list.selectionModel()
+        list_selection.blockSignals(True)
+        index = self._list_model.index_for_name(name)
+        if index.isValid():
+            self._list.setCurrentIndex(index)
+        else:
             self._list.clearSelection()
-        self._list.blockSignals(False)
-
-        self._tree.blockSignals(True)
-        matched_item: QTreeWidgetItem | None = None
-        for item in self._iter_tree_items():
-            data = item.data(0, Qt.ItemDataRole.UserRole)
-            if isinstance(data, CategoryRow) and data.name.lower() == lookup:
-                matched_item = item
-                break
-        if matched_item is not None:
-            self._tree.setCurrentItem(matched_item)
-            self._tree.scrollToItem(matched_item)
+        list_selection.blockSignals(False)
+
+    def _select_in_tree(self, name: str) -> None:
+        tree_selection = self._tree.selectionModel()
+        tree_selection.blockSignals(True)
+        index = self._tree_model.index_for_name(name)
+        if index.isValid():
+            self._tree.setCurrentIndex(index)
+            self._tree.scrollTo(index)
         else:
             self._tree.clearSelection()
-        self._tree.blockSignals(False)
-
-    def _iter_tree_items(self) -> list[QTreeWidgetItem]:
-        items: list[QTreeWidgetItem] = []
-        stack: list[QTreeWidgetItem] = [
-            self._tree.topLevelItem(i) for i in range(self._tree.topLevelItemCount())
-        ]
-        while stack:
-            item = stack.pop()
-            if item is None:
-                continue
-            items.append(item)
-            for idx in range(item.childCount() - 1, -1, -1):
-                stack.append(item.child(idx))
-        return items
+        tree_selection.blockSignals(False)
 
     def _on_add_clicked(self) -> None:
+        self._settle_counts()
         new_name = self._prompt_for_name("Add Category", "Category name:")
         if new_name is None:
             return
@@ -422,13 +458,14 @@ class CategoriesDialog(QDialog):
         self._select_category(new_name)
 
     def _on_rename_clicked(self) -> None:
+        self._settle_counts()
         row = self._current_row()
         if row is None:
             return
         new_name = self._prompt_for_name("Rename Category", "New name:", row.name)
         if new_name is None:
             return
-        if new_name.lower() == row.name.lower():
+        if new_name.lower() == row.key:
             self._status_label.setText("No changes made.")
             return
         if self._category_exists(new_name, exclude=row.name):
@@ -443,6 +480,7 @@ class CategoriesDialog(QDialog):
         except PersistenceError as exc:
             QMessageBox.critical(self, "Unable to rename", str(exc))
             return
+        self._counts_dirty = True
 
         try:
             if row.managed:
@@ -463,19 +501,18 @@ class CategoriesDialog(QDialog):
             QMessageBox.critical(self, "Unable to update category store", str(exc))
             return
 
-        suffix = "entry" if updated == 1 else "entries"
-        self._status_label.setText(f"Renamed category for {updated} {suffix}.")
+        self._status_label.setText(f"Renamed category for {count_phrase(updated)}.")
         self._refresh_list()
         self._select_category(new_name)
 
     def _on_delete_clicked(self) -> None:
+        self._settle_counts()
         row = self._current_row()
         if row is None:
             return
         if row.count > 0:
-            suffix = "entry" if row.count == 1 else "entries"
             message = (
-                f"Remove '{row.name}' and clear it from {row.count} {suffix}?\n\n"
+                f"Remove '{row.name}' and clear it from {count_phrase(row.count)}?\n\n"
                 "Entries keep their other details."
             )
             confirm = QMessageBox.question(
@@ -503,6 +540,7 @@ class CategoriesDialog(QDialog):
         except PersistenceError as exc:
             QMessageBox.critical(self, "Unable to update entries", str(exc))
             return
+        self._counts_dirty = True
 
         if row.managed:
             try:
@@ -512,7 +550,7 @@ class CategoriesDialog(QDialog):
                 return
 
         self._status_label.setText(
-            "Category removed." if cleared == 0 else f"Cleared from {cleared} entries."
+            "Category removed." if cleared == 0 else f"Cleared from {count_phrase(cleared)}."
         )
         self._refresh_list()
         self._notify_entries_updated()
@@ -522,10 +560,9 @@ class CategoriesDialog(QDialog):
         if row is None or not row.managed:
             return
 
-        order = self._category_manager.list_categories()
-        try:
-            index = next(i for i, name in enumerate(order) if name.lower() == row.name.lower())
-        except StopIteration:
+        order = self._managed_order
+        index = self._managed_index.get(row.key)
+        if index is None:
             return
 
         target_index = index + delta
@@ -546,6 +583,10 @@ class CategoriesDialog(QDialog):
         self._refresh_list()
 
     def _on_bulk_edit_clicked(self) -> None:
+        # Only loaded on demand, like the name prompt: most sessions never open the editor.
+        from PySide6.QtWidgets import QPlainTextEdit
+
+        self._settle_counts()
         dialog = QDialog(self)
         dialog.setWindowTitle("Bulk Edit Categories")
 
@@ -566,7 +607,8 @@ class CategoriesDialog(QDialog):
 
         editor = QPlainTextEdit(dialog)
         editor.setPlaceholderText("One category per line")
-        editor.setPlainText("\n".join(self._bulk_editor_initial_lines()))
+        initial_text = "\n".join(self._bulk_editor_initial_lines())
+        editor.setPlainText(initial_text)
         editor.setMinimumHeight(240)
         layout.addWidget(editor)
 
@@ -580,32 +622,32 @@ class CategoriesDialog(QDialog):
         if dialog.exec() != QDialog.DialogCode.Accepted:
             return
 
-        new_names = self._normalize_bulk_lines(editor.toPlainText())
+        text = editor.toPlainText()
+        if text == initial_text:
+            self._status_label.setText("Bulk edit made no changes.")
+            return
+
+        # (name, lowercased key) pairs, unique by key; every comparison below reuses the keys.
+        new_entries = self._normalize_bulk_lines(text)
+        new_keys = {key for _name, key in new_entries}
 
         previous_order = self._category_manager.list_categories()
-        previous_order_cf = [name.casefold() for name in previous_order]
-        previous_keys = set(previous_order_cf)
+        previous_order_keys = [name.lower() for name in previous_order]
+        previous_keys = set(previous_order_keys)
 
-        existing_map = {row.name.casefold(): row for row in self._rows}
-        existing_keys = set(existing_map.keys())
-        new_keys = {name.casefold() for name in new_names}
+        existing_map = {row.key: row for row in self._rows}
 
-        desired_existing_order = [name for name in new_names if name.casefold() in previous_keys]
         order_change_requested = (
-            [name.casefold() for name in desired_existing_order] != previous_order_cf
+            [key for _name, key in new_entries if key in previous_keys] != previous_order_keys
         )
 
-        to_remove = [existing_map[key] for key in existing_keys - new_keys]
+        to_remove = [row for key, row in existing_map.items() if key not in new_keys]
 
-        added_lower: set[str] = set()
         to_add: list[str] = []
-        for name in new_names:
-            key = name.casefold()
+        for name, key in new_entries:
             row = existing_map.get(key)
             if row is None or not row.managed:
-                if key not in added_lower:
-                    to_add.append(name)
-                    added_lower.add(key)
+                to_add.append(name)
 
         if not to_add and not to_remove and not order_change_requested:
             self._status_label.setText("Bulk edit made no changes.")
@@ -614,7 +656,7 @@ class CategoriesDialog(QDialog):
         impacted = [row for row in to_remove if row.count > 0]
         if impacted:
             lines = "\n".join(
-                f"- {row.name} ({row.count} {'entry' if row.count == 1 else 'entries'})"
+                f"- {row.name} ({count_phrase(row.count)})"
                 for row in impacted
             )
             message = (
@@ -634,55 +676,53 @@ class CategoriesDialog(QDialog):
                 return
 
         added_count = 0
-        for name in to_add:
-            try:
-                self._category_manager.add_category(name)
-            except ValueError as exc:
-                QMessageBox.warning(self, "Unable to add category", str(exc))
-                self._refresh_list()
-                return
-            except PersistenceError as exc:
-                QMessageBox.critical(self, "Unable to add category", str(exc))
-                self._refresh_list()
-                return
-            added_count += 1
-
         removed_count = 0
         cleared_entries = 0
-        for row in to_remove:
-            try:
-                cleared = self._repository.clear_category(row.name)
-            except PersistenceError as exc:
-                QMessageBox.critical(self, "Unable to update entries", str(exc))
-                self._refresh_list()
-                return
-            cleared_entries += cleared
-            removed_count += 1
-            if row.managed:
+        # Every path out of the store updates below, including failures, ends in one refresh.
+        try:
+            if to_add:
                 try:
-                    self._category_manager.delete_category(row.name)
+                    added_count = self._category_manager.add_categories(to_add)
+                except ValueError as exc:
+                    QMessageBox.warning(self, "Unable to add category", str(exc))
+                    return
                 except PersistenceError as exc:
-                    QMessageBox.critical(self, "Unable to update category store", str(exc))
-                    self._refresh_list()
+                    QMessageBox.critical(self, "Unable to add category", str(exc))
                     return
 
-        try:
-            current_after = self._category_manager.list_categories()
-            current_keys = {name.casefold() for name in current_after}
-            desired_final = [name for name in new_names if name.casefold() in current_keys]
-            if current_after or desired_final:
-                self._category_manager.reorder_categories(desired_final)
-            final_order = self._category_manager.list_categories()
-        except (ValueError, PersistenceError) as exc:
-            QMessageBox.critical(self, "Unable to finalize category order", str(exc))
+            for row in to_remove:
+                try:
+                    cleared = self._repository.clear_category(row.name)
+                except PersistenceError as exc:
+                    QMessageBox.critical(self, "Unable to update entries", str(exc))
+                    return
+                self._counts_dirty = True
+                cleared_entries += cleared
+                removed_count += 1
+                if row.managed:
+                    try:
+                        self._category_manager.delete_category(row.name)
+                    except PersistenceError as exc:
+                        QMessageBox.critical(self, "Unable to update category store", str(exc))
+                        return
+
+            try:
+                current_after = self._category_manager.list_categories()
+                current_keys = {name.lower() for name in current_after}
+                desired_final = [name for name, key in new_entries if key in current_keys]
+                if current_after or desired_final:
+                    self._category_manager.reorder_categories(desired_final)
+                final_order = self._category_manager.list_categories()
+            except (ValueError, PersistenceError) as exc:
+                QMessageBox.critical(self, "Unable to finalize category order", str(exc))
+                return
+        finally:
             self._refresh_list()
-            return
 
         order_changed_final = (
-            [name.casefold() for name in final_order] != previous_order_cf
+            [name.lower() for name in final_order] != previous_order_keys
         )
 
-        self._refresh_list()
         if to_add:
             self._select_category(to_add[0])
         if removed_count:
@@ -690,17 +730,11 @@ class CategoriesDialog(QDialog):
 
         summary_parts: list[str] = []
         if added_count:
-            summary_parts.append(
-                f"added {added_count} {'category' if added_count == 1 else 'categories'}"
-            )
+            summary_parts.append(f"added {count_phrase(added_count, CATEGORY_WORDS)}")
         if removed_count:
-            summary_parts.append(
-                f"removed {removed_count} {'category' if removed_count == 1 else 'categories'}"
-            )
+            summary_parts.append(f"removed {count_phrase(removed_count, CATEGORY_WORDS)}")
         if cleared_entries:
-            summary_parts.append(
-                f"cleared {cleared_entries} {'entry' if cleared_entries == 1 else 'entries'}"
-            )
+            summary_parts.append(f"cleared {count_phrase(cleared_entries)}")
         if order_changed_final:
             summary_parts.append("updated category order")
 
@@ -710,46 +744,48 @@ class CategoriesDialog(QDialog):
             else "Bulk edit applied."
         )
 
-    def _on_tree_item_double_clicked(self, item: QTreeWidgetItem, _column: int) -> None:
-        data = item.data(0, Qt.ItemDataRole.UserRole)
-        if isinstance(data, CategoryRow):
+    def _on_tree_item_double_clicked(self, index: QModelIndex) -> None:
+        if self._tree_model.row_at(index) is not None:
             self._on_rename_clicked()
 
     def _prompt_for_name(
         self, title: str, label: str, default: str | None = None
     ) -> str | None:
-        text, ok = QInputDialog.getText(self, title, label, text=default or "")
-        if not ok:
+        dialog = self._name_input_dialog
+        if dialog is None:
+            from PySide6.QtWidgets import QInputDialog
+
+            dialog = QInputDialog(self)
+            dialog.setInputMode(QInputDialog.InputMode.TextInput)
+            self._name_input_dialog = dialog
+        dialog.setWindowTitle(title)
+        dialog.setLabelText(label)
+        dialog.setTextValue(default or "")
+        if dialog.exec() != QDialog.DialogCode.Accepted:
             return None
-        trimmed = text.strip()
+        trimmed = dialog.textValue().strip()
         return trimmed or None
 
     def _category_exists(self, name: str, *, exclude: str | None = None) -> bool:
         lookup = name.lower()
-        excluded = exclude.lower() if exclude else None
-        for row in self._rows:
-            if excluded is not None and row.name.lower() == excluded:
-                continue
-            if row.name.lower() == lookup:
-                return True
-        return False
+        if exclude and exclude.lower() == lookup:
+            return False
+        return lookup in self._rows_by_key
 
     def _sync_button_states(self) -> None:
+        self._sync_timer.start()
+
+    def _apply_button_states(self) -> None:
         row = self._current_row()
         has_selection = row is not None
         self._rename_button.setEnabled(has_selection)
         self._delete_button.setEnabled(has_selection)
         can_move = has_selection and row is not None and row.managed
         if can_move:
-            order = [managed.name for managed in self._rows if managed.managed]
-            try:
-                index = next(
-                    idx for idx, name in enumerate(order) if name.lower() == row.name.lower()
-                )
-            except StopIteration:
-                index = -1
+            index = self._managed_index.get(row.key, -1)
+            last = len(self._managed_order) - 1
             self._move_up_button.setEnabled(index > 0)
-            self._move_down_button.setEnabled(0 <= index < len(order) - 1)
+            self._move_down_button.setEnabled(0 <= index < last)
         else:
             self._move_up_button.setEnabled(False)
             self._move_down_button.setEnabled(False)
@@ -764,12 +800,12 @@ class CategoriesDialog(QDialog):
 
     def _bulk_editor_initial_lines(self) -> list[str]:
         managed = [row.name for row in self._rows if row.managed]
-        seen = {name.casefold() for name in managed}
+        seen = {name.lower() for name in managed}
         unmanaged: list[str] = []
         for row in self._rows:
             if row.managed:
                 continue
-            key = row.name.casefold()
+            key = row.key
             if key in seen:
                 continue
             unmanaged.append(row.name)
@@ -777,16 +813,16 @@ class CategoriesDialog(QDialog):
         unmanaged.sort(key=str.casefold)
         return managed + unmanaged
 
-    def _normalize_bulk_lines(self, text: str) -> list[str]:
-        names: list[str] = []
+    def _normalize_bulk_lines(self, text: str) -> list[tuple[str, str]]:
+        entries: list[tuple[str, str]] = []
         seen: set[str] = set()
         for raw in text.splitlines():
             candidate = raw.strip()
             if not candidate:
                 continue
-            folded = candidate.casefold()
-            if folded in seen:
+            key = candidate.lower()
+            if key in seen:
                 continue
-            names.append(candidate)
-            seen.add(folded)
-        return names
+            entries.append((candidate, key))
+            seen.add(key)
+        return entries
@@ -0,0 +1,429 @@
+"""Item models backing the flat and tree views of the categories dialog."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from typing import Sequence
+
+from PySide6.QtCore import QAbstractItemModel, QAbstractListModel, QModelIndex, QObject, Qt
+from PySide6.QtGui import QFont
+
+from .category_picker import CATEGORY_PATH_SEPARATOR
+
+PLACEHOLDER_TEXT = "No categories yet"
+# Plural and singular noun, indexed by ``count == 1``.
+ENTRY_WORDS = ("entries", "entry")
+CATEGORY_WORDS = ("categories", "category")
+_UNSAVED_TOOLTIP = "Category exists in entries but is not saved. Rename or delete to resolve."
+
+# Joins lowercased segments into tree path keys; it cannot appear in a category name.
+_PATH_JOIN = "\x00"
+
+_SELECTABLE = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+_ROW_ROLES = [
+    Qt.ItemDataRole.DisplayRole,
+    Qt.ItemDataRole.FontRole,
+    Qt.ItemDataRole.ToolTipRole,
+]
+
+
+@dataclass(slots=True)
+class CategoryRow:
+    name: str
+    count: int
+    managed: bool
+    # Lowercased name, the key CategoryManager and the repository match on; rows,
+    # tree nodes and lookups are all matched on it.
+    key: str = field(init=False, repr=False, compare=False)
+    # Tree path segments and their lowercased keys, parsed once per row.
+    parts: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    keys: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    # Display text for the flat list and for the row's own node in the tree.
+    label: str = field(init=False, repr=False, compare=False)
+    tree_label: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.key = self.name.lower()
+        self.parts, self.keys = _split_path(self.name)
+        self._format_labels()
+
+    def update(self, count: int, managed: bool) -> None:
+        if count == self.count and managed == self.managed:
+            return
+        self.count = count
+        self.managed = managed
+        self._format_labels()
+
+    def _format_labels(self) -> None:
+        self.label = format_row_label(self)
+        leaf = self.parts[-1]
+        self.tree_label = self.label if leaf == self.name else format_row_label(self, display_name=leaf)
+
+
+def format_row_label(row: CategoryRow, *, display_name: str | None = None) -> str:
+    name = display_name if display_name is not None else row.name
+    label = f"{name} ({count_phrase(row.count)})"
+    if not row.managed:
+        label += " [unsaved]"
+    return label
+
+
+def count_phrase(count: int, words: tuple[str, str] = ENTRY_WORDS) -> str:
+    """``count`` followed by the matching noun from ``words``, e.g. ``1 entry``."""
+    return f"{count} {words[count == 1]}"
+
+
+def _split_path(name: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    segments = (segment.strip() for segment in name.split(CATEGORY_PATH_SEPARATOR))
+    parts = tuple(segment for segment in segments if segment) or (name,)
+    return parts, tuple(segment.lower() for segment in parts)
+
+
+def _diff_opcodes(old_keys: list, new_keys: list) -> list[tuple[str, int, int, int, int]]:
+    # Applied back to front so the indices of pending opcodes stay valid while rows move.
+    matcher = SequenceMatcher(None, old_keys, new_keys, autojunk=False)
+    return list(reversed(matcher.get_opcodes()))
+
+
+def _italic_font(base: QFont | None = None) -> QFont:
+    font = QFont(base) if base is not None else QFont()
+    font.setItalic(True)
+    return font
+
+
+def _row_data(row: CategoryRow, role: int, italic: QFont) -> object:
+    if role == Qt.ItemDataRole.FontRole:
+        return italic if not row.managed else None
+    if role == Qt.ItemDataRole.ToolTipRole:
+        return row.name if row.managed else _UNSAVED_TOOLTIP
+    return None
+
+
+class CategoryListModel(QAbstractListModel):
+    """Category rows in display order, with a disabled placeholder while there are none."""
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._rows: list[CategoryRow] = []
+        # Labels as last reported to views; rows are updated in place, so changes are
+        # detected against these rather than by comparing rows.
+        self._labels: list[str] = []
+        self._positions: dict[str, int] = {}
+        self._italic = _italic_font()
+
+    # ------------------------------------------------------------------
+    def rowCount(self, parent: QModelIndex | None = None) -> int:  # type: ignore[override]
+        if parent and parent.isValid():
+            return 0
+        return len(self._rows) or 1
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):  # type: ignore[override]
+        if not index.isValid():
+            return None
+        row = self.row_at(index)
+        if row is None:
+            return PLACEHOLDER_TEXT if role == Qt.ItemDataRole.DisplayRole else None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return row.label
+        return _row_data(row, role, self._italic)
+
+    def flags(self, index: QModelIndex):  # type: ignore[override]
+        if self.row_at(index) is None:
+            return Qt.ItemFlag.NoItemFlags
+        return _SELECTABLE
+
+    # ------------------------------------------------------------------
+    def set_base_font(self, font: QFont) -> None:
+        """Derive the italic font for unsaved categories from the view's ``font``."""
+        self._italic = _italic_font(font)
+
+    def set_rows(self, rows: Sequence[CategoryRow]) -> None:
+        """Apply ``rows`` as row insertions, removals and changes against the current rows."""
+        self._apply_rows(list(rows))
+        self._positions = {row.key: position for position, row in enumerate(self._rows)}
+
+    def _apply_rows(self, rows: list[CategoryRow]) -> None:
+        if not self._rows or not rows:
+            # Swapping the placeholder in or out is simpler as a reset and only happens at the edges.
+            self.beginResetModel()
+            self._rows = rows
+            self._labels = [row.label for row in rows]
+            self.endResetModel()
+            return
+
+        old_keys = [row.key for row in self._rows]
+        new_keys = [row.key for row in rows]
+        for tag, i1, i2, j1, j2 in _diff_opcodes(old_keys, new_keys):
+            if tag == "equal":
+                self._update_rows(i1, rows[j1:j2])
+                continue
+            if i2 > i1:
+                self.beginRemoveRows(QModelIndex(), i1, i2 - 1)
+                del self._rows[i1:i2]
+                del self._labels[i1:i2]
+                self.endRemoveRows()
+            if j2 > j1:
+                self.beginInsertRows(QModelIndex(), i1, i1 + (j2 - j1) - 1)
+                self._rows[i1:i1] = rows[j1:j2]
+                self._labels[i1:i1] = [row.label for row in rows[j1:j2]]
+                self.endInsertRows()
+
+    def _update_rows(self, first: int, rows: Sequence[CategoryRow]) -> None:
+        for position, row in enumerate(rows, first):
+            self._rows[position] = row
+            if self._labels[position] != row.label:
+                self._labels[position] = row.label
+                index = self.index(position, 0)
+                self.dataChanged.emit(index, index, _ROW_ROLES)
+
+    def row_at(self, index: QModelIndex) -> CategoryRow | None:
+        if not index.isValid() or not (0 <= index.row() < len(self._rows)):
+            return None
+        return self._rows[index.row()]
+
+    def index_for_name(self, name: str) -> QModelIndex:
+        position = self._positions.get(name.lower())
+        if position is None:
+            return QModelIndex()
+        return self.index(position, 0)
+
+
+@dataclass(slots=True, eq=False)
+class _CategoryNode:
+    text: str
+    key: str | None = None
+    parent: _CategoryNode | None = None
+    position: int = 0
+    depth: int = 0
+    row: CategoryRow | None = None
+    flags: Qt.ItemFlag = Qt.ItemFlag.ItemIsEnabled
+    children: list[_CategoryNode] = field(default_factory=list)
+    by_key: dict[str | None, _CategoryNode] = field(default_factory=dict)
+    # Rows below this node whose nodes have not been created yet; ``None`` once fetched.
+    pending: list[CategoryRow] | None = None
+
+    @property
+    def has_children(self) -> bool:
+        return bool(self.children) or self.pending is not None
+
+    def add_child(
+        self, text: str, key: str | None, flags: Qt.ItemFlag = Qt.ItemFlag.ItemIsEnabled
+    ) -> _CategoryNode:
+        child = _CategoryNode(
+            text=text,
+            key=key,
+            parent=self,
+            position=len(self.children),
+            depth=self.depth + 1,
+            flags=flags,
+        )
+        self.children.append(child)
+        self.by_key[key] = child
+        return child
+
+    def materialize(self) -> list[_CategoryNode]:
+        """Create this node's children from its pending rows, one level deep."""
+        pending, self.pending = self.pending, None
+        level = self.depth
+        child: _CategoryNode | None = None
+        for row in pending or ():
+            key = row.keys[level]
+            # Rows sharing a parent are usually listed together; reuse the previous child.
+            if child is None or child.key != key:
+                child = self.by_key.get(key)
+                if child is None:
+                    child = self.add_child(row.parts[level], key)
+            if len(row.parts) == level + 1:
+                child.row = row
+                child.text = row.tree_label
+                child.flags = _SELECTABLE
+            elif child.pending is None:
+                child.pending = [row]
+            else:
+                child.pending.append(row)
+        return self.children
+
+    def renumber(self, start: int = 0) -> None:
+        for position in range(start, len(self.children)):
+            self.children[position].position = position
+
+
+def _build_tree(rows: Sequence[CategoryRow]) -> _CategoryNode:
+    root = _CategoryNode(text="")
+    if not rows:
+        root.add_child(PLACEHOLDER_TEXT, None, Qt.ItemFlag.NoItemFlags)
+        return root
+    root.pending = list(rows)
+    root.materialize()
+    return root
+
+
+class CategoryTreeModel(QAbstractItemModel):
+    """Categories nested by their ``CATEGORY_PATH_SEPARATOR`` path segments.
+
+    Nodes are plain Python objects referenced from each index's internal pointer; parent
+    segments without a category of their own are shown but cannot be selected. Only the
+    top level is built up front: a branch creates its children when a view first fetches
+    them, so refresh cost follows what has been opened rather than the whole hierarchy.
+    """
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._root = _CategoryNode(text="")
+        self._italic = _italic_font()
+
+    # ------------------------------------------------------------------
+    def index(self, row: int, column: int, parent: QModelIndex | None = None) -> QModelIndex:  # type: ignore[override]
+        node = self._node(parent)
+        if column != 0 or not (0 <= row < len(node.children)):
+            return QModelIndex()
+        return self.createIndex(row, column, node.children[row])
+
+    def parent(self, index: QModelIndex) -> QModelIndex:  # type: ignore[override]
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self._root:
+            return QModelIndex()
+        return self.createIndex(parent.position, 0, parent)
+
+    def rowCount(self, parent: QModelIndex | None = None) -> int:  # type: ignore[override]
+        if parent is not None and parent.isValid() and parent.column() != 0:
+            return 0
+        return len(self._node(parent).children)
+
+    def columnCount(self, parent: QModelIndex | None = None) -> int:  # type: ignore[override]
+        return 1
+
+    def hasChildren(self, parent: QModelIndex | None = None) -> bool:  # type: ignore[override]
+        if parent is not None and parent.isValid() and parent.column() != 0:
+            return False
+        return self._node(parent).has_children
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:  # type: ignore[override]
+        return self._node(parent).pending is not None
+
+    def fetchMore(self, parent: QModelIndex) -> None:  # type: ignore[override]
+        node = self._node(parent)
+        if node.pending is None:
+            return
+        staged = _CategoryNode(text="", depth=node.depth, pending=node.pending)
+        children = staged.materialize()
+        for child in children:
+            child.parent = node
+        self.beginInsertRows(parent, 0, len(children) - 1)
+        node.children = children
+        node.by_key = staged.by_key
+        node.pending = None
+        self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):  # type: ignore[override]
+        if not index.isValid():
+            return None
+        node: _CategoryNode = index.internalPointer()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return node.text
+        if node.row is None:
+            return None
+        return _row_data(node.row, role, self._italic)
+
+    def flags(self, index: QModelIndex):  # type: ignore[override]
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return index.internalPointer().flags
+
+    # ------------------------------------------------------------------
+    def set_base_font(self, font: QFont) -> None:
+        """Derive the italic font for unsaved categories from the view's ``font``."""
+        self._italic = _italic_font(font)
+
+    def set_rows(self, rows: Sequence[CategoryRow]) -> None:
+        """Reconcile the tree with ``rows`` one parent at a time.
+
+        Nodes that survive keep their identity, so views retain their expansion state and
+        selection; only inserted, removed or relabelled nodes are reported to them.
+        """
+        self._sync_children(QModelIndex(), self._root, _build_tree(rows).children)
+
+    def _sync_children(
+        self, parent_index: QModelIndex, node: _CategoryNode, fresh: list[_CategoryNode]
+    ) -> None:
+        # A node that gains or loses its children is replaced rather than updated, so views
+        # pick up the change in their branch indicators.
+        old_keys = [(child.key, child.has_children) for child in node.children]
+        new_keys = [(child.key, child.has_children) for child in fresh]
+        reshaped = False
+        for tag, i1, i2, j1, j2 in _diff_opcodes(old_keys, new_keys):
+            if tag == "equal":
+                for current, replacement in zip(node.children[i1:i2], fresh[j1:j2]):
+                    self._sync_node(current, replacement)
+                continue
+            reshaped = True
+            if i2 > i1:
+                self.beginRemoveRows(parent_index, i1, i2 - 1)
+                del node.children[i1:i2]
+                node.renumber(i1)
+                self.endRemoveRows()
+            if j2 > j1:
+                self.beginInsertRows(parent_index, i1, i1 + (j2 - j1) - 1)
+                for child in fresh[j1:j2]:
+                    child.parent = node
+                node.children[i1:i1] = fresh[j1:j2]
+                node.renumber(i1)
+                self.endInsertRows()
+        if reshaped:
+            node.by_key = {child.key: child for child in node.children}
+
+    def _sync_node(self, node: _CategoryNode, replacement: _CategoryNode) -> None:
+        index = self.createIndex(node.position, 0, node)
+        changed = (node.text, node.row, node.flags) != (replacement.text, replacement.row, replacement.flags)
+        node.text, node.row, node.flags = replacement.text, replacement.row, replacement.flags
+        if changed:
+            self.dataChanged.emit(index, index, _ROW_ROLES)
+        if node.pending is not None:
+            # No view has fetched this branch yet, so its rows can be swapped silently.
+            node.pending = replacement.pending
+            return
+        if replacement.pending is not None:
+            replacement.materialize()
+        self._sync_children(index, node, replacement.children)
+
+    def row_at(self, index: QModelIndex) -> CategoryRow | None:
+        if not index.isValid():
+            return None
+        return index.internalPointer().row
+
+    def index_for_name(self, name: str) -> QModelIndex:
+        """Index of the category ``name``, fetching the branches on its path as needed."""
+        _parts, keys = _split_path(name)
+        node = self._root
+        index = QModelIndex()
+        for key in keys:
+            if node.pending is not None:
+                self.fetchMore(index)
+            node = node.by_key.get(key)
+            if node is None:
+                return QModelIndex()
+            index = self.createIndex(node.position, 0, node)
+        return index if node.row is not None else QModelIndex()
+
+    def key_path(self, index: QModelIndex) -> str:
+        """Casefolded path of ``index``, stable across refreshes; empty for the root."""
+        keys: list[str] = []
+        node = self._node(index)
+        while node.parent is not None:
+            keys.append(node.key or "")
+            node = node.parent
+        return _PATH_JOIN.join(reversed(keys))
+
+    def child_key_path(self, parent_path: str, index: QModelIndex) -> str:
+        """``key_path(index)`` extended from its parent's path without walking up the tree."""
+        key = self._node(index).key or ""
+        return f"{parent_path}{_PATH_JOIN}{key}" if parent_path else key
+
+    # ------------------------------------------------------------------
+    def _node(self, index: QModelIndex | None) -> _CategoryNode:
+        if index is not None and index.isValid():
+            return index.internalPointer()
+        return self._root
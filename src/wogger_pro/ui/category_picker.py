@@ -20,6 +20,9 @@ CATEGORY_PATH_SEPARATOR = " - "
 _CATEGORY_ROLE = Qt.ItemDataRole.UserRole + 41
 _NONE_KEY = "__none__"
 
+# Tree node paths mapped to the category a node selects, or None for grouping-only nodes.
+_NodeValues = Dict[Tuple[str, ...], Optional[str]]
+
 
 class _CategoryTreePopup(QFrame):
     category_chosen = Signal(object, object)
@@ -41,10 +44,18 @@ class _CategoryTreePopup(QFrame):
         self._tree.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self._tree.clicked.connect(self._on_clicked)
         layout.addWidget(self._tree)
+        # Model the tree was last expanded for; held by reference since an id() can be reused.
+        self._expanded_model: QStandardItemModel | None = None
 
     def set_model(self, model: QStandardItemModel) -> None:
+        if model is self._expanded_model:
+            return
         self._tree.setModel(model)
         self._tree.expandAll()
+        self._expanded_model = model
+
+    def expand_item(self, index) -> None:
+        self._tree.expand(index)
 
     def set_current_index(self, index) -> None:
         if index is not None and index.isValid():
@@ -103,10 +114,15 @@ class CategoryTreePicker(QWidget):
         self._model = QStandardItemModel()
         self._node_lookup: Dict[Tuple[str, ...], QStandardItem] = {}
         self._item_lookup: Dict[str, QStandardItem] = {}
+        self._node_values: _NodeValues = {}
+        # Path parts of each listed category, split once per set_categories call.
+        self._parts_cache: Dict[str, Tuple[str, ...]] = {}
 
         self._popup = _CategoryTreePopup(self)
         self._popup.category_chosen.connect(self._on_popup_chosen)
         self._popup.closed.connect(self._on_popup_closed)
+        self._rebuild_model({}, {})
+        self._popup.set_model(self._model)
 
         self._line_edit = QLineEdit(self)
         self._line_edit.setReadOnly(True)
@@ -115,6 +131,9 @@ class CategoryTreePicker(QWidget):
         self._line_edit.setObjectName("categoryTreePickerLineEdit")
         self._line_edit.installEventFilter(self)
         self._full_display_text = ""
+        # Metrics for the line edit's font; rebuilt only when the font key changes.
+        self._cached_metrics: QFontMetrics | None = None
+        self._cached_font_key: str | None = None
 
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
 
@@ -129,6 +148,13 @@ class CategoryTreePicker(QWidget):
         super().resizeEvent(event)
         self._apply_elided_text()
 
+    def changeEvent(self, event) -> None:  # type: ignore[override]
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.FontChange:
+            self._cached_metrics = None
+            self._cached_font_key = None
+            self._apply_elided_text()
+
     # ------------------------------------------------------------------
     def set_categories(self, categories: Sequence[str]) -> None:
         sanitized: list[str] = []
@@ -145,8 +171,19 @@ class CategoryTreePicker(QWidget):
         self._categories = sanitized
 
         previous = self._current_category
-        self._rebuild_model()
-        self._popup.set_model(self._model)
+        self._parts_cache = {category: _split_category(category, self._separator) for category in sanitized}
+        nodes, lookup = _category_tree_spec(self._parts_cache, self._separator)
+        if not _same_sibling_order(self._node_values, nodes):
+            self._rebuild_model(nodes, lookup)
+            self._popup.set_model(self._model)
+        else:
+            # Only the delta touches the model, so rows the popup already shows keep their items.
+            self._popup.setUpdatesEnabled(False)
+            try:
+                for item in self._apply_nodes(nodes, lookup):
+                    self._popup.expand_item(item.index())
+            finally:
+                self._popup.setUpdatesEnabled(True)
         self.set_current_category(previous)
 
     def categories(self) -> list[str]:
@@ -178,7 +215,6 @@ class CategoryTreePicker(QWidget):
     def open_popup(self) -> None:
         if not self.isEnabled():
             return
-        self._popup.set_model(self._model)
         if self._current_category:
             item = self._item_lookup.get(self._current_category.lower())
             if item is not None:
@@ -244,7 +280,7 @@ class CategoryTreePicker(QWidget):
 
     def _display_text_for_current(self) -> str:
         if self._current_category:
-            parts = [part.strip() for part in self._current_category.split(self._separator) if part.strip()]
+            parts = self._category_parts(self._current_category)
             if parts:
                 return parts[-1]
             return self._current_category
@@ -269,16 +305,28 @@ class CategoryTreePicker(QWidget):
         if available_width <= 0:
             display_text = full_text
         else:
-            metrics = QFontMetrics(self._line_edit.font())
-            display_text = metrics.elidedText(full_text, Qt.TextElideMode.ElideRight, available_width)
+            metrics = self._line_metrics()
+            if metrics.horizontalAdvance(full_text) <= available_width:
+                display_text = full_text
+            else:
+                display_text = metrics.elidedText(full_text, Qt.TextElideMode.ElideRight, available_width)
         if self._line_edit.text() != display_text:
             self._line_edit.setText(display_text)
 
-    def _rebuild_model(self) -> None:
+    def _line_metrics(self) -> QFontMetrics:
+        font = self._line_edit.font()
+        key = font.key()
+        if self._cached_metrics is None or key != self._cached_font_key:
+            self._cached_metrics = QFontMetrics(font)
+            self._cached_font_key = key
+        return self._cached_metrics
+
+    def _rebuild_model(self, nodes: _NodeValues, lookup: Dict[str, Tuple[str, ...]]) -> None:
         self._model = QStandardItemModel()
         self._model.setHorizontalHeaderLabels(["Category"])
         self._node_lookup.clear()
         self._item_lookup.clear()
+        self._node_values = {}
         if self._allow_none:
             none_item = QStandardItem("(No category)")
             none_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
@@ -286,8 +334,65 @@ class CategoryTreePicker(QWidget):
             none_item.setData("", Qt.EditRole)
             self._model.appendRow(none_item)
             self._item_lookup[_NONE_KEY] = none_item
-        for category in self._categories:
-            self._ensure_category(category)
+        self._apply_nodes(nodes, lookup)
+
+    def _apply_nodes(self, nodes: _NodeValues, lookup: Dict[str, Tuple[str, ...]]) -> list[QStandardItem]:
+        """Bring the model in line with ``nodes``; returns the items that newly have children.
+
+        Callers must have checked that surviving siblings keep their relative order.
+        """
+        root = self._model.invisibleRootItem()
+        previous = self._node_values
+        for path in previous:
+            if path in nodes:
+                continue
+            item = self._node_lookup.pop(path)
+            # Removing the topmost dropped node takes its whole subtree with it.
+            if len(path) == 1 or path[:-1] in nodes:
+                (item.parent() or root).removeRow(item.row())
+
+        rows: Dict[Tuple[str, ...], int] = {(): 1 if _NONE_KEY in self._item_lookup else 0}
+        # New nodes under existing parents, grouped per parent as (row, item) in row order.
+        inserts: Dict[Tuple[str, ...], list[Tuple[int, QStandardItem]]] = {}
+        for path, value in nodes.items():
+            parent_path = path[:-1]
+            row = rows.get(parent_path, 0)
+            rows[parent_path] = row + 1
+            item = self._node_lookup.get(path)
+            if item is None:
+                item = _category_item(path[-1], value)
+                self._node_lookup[path] = item
+                if parent_path in previous or not parent_path:
+                    inserts.setdefault(parent_path, []).append((row, item))
+                else:
+                    # The parent is new as well and not in the model yet, so this emits nothing.
+                    self._node_lookup[parent_path].appendRow(item)
+            elif previous[path] != value:
+                _assign_category(item, path[-1], value)
+
+        # Whole subtrees go in with one insertRows per run of adjacent rows.
+        for parent_path, pending in inserts.items():
+            parent = self._node_lookup[parent_path] if parent_path else root
+            start = 0
+            for end in range(1, len(pending) + 1):
+                if end == len(pending) or pending[end][0] != pending[end - 1][0] + 1:
+                    parent.insertRows(pending[start][0], [item for _, item in pending[start:end]])
+                    start = end
+
+        old_parents = {path[:-1] for path in previous}
+        grown = [self._node_lookup[path] for path in rows if path and path not in old_parents]
+        self._node_values = nodes
+        none_item = self._item_lookup.get(_NONE_KEY)
+        self._item_lookup = {key: self._node_lookup[path] for key, path in lookup.items()}
+        if none_item is not None:
+            self._item_lookup[_NONE_KEY] = none_item
+        return grown
+
+    def _category_parts(self, category: str) -> Tuple[str, ...]:
+        parts = self._parts_cache.get(category)
+        if parts is None:
+            parts = _split_category(category, self._separator)
+        return parts
 
     def _ensure_category(self, category: str) -> Optional[QStandardItem]:
         normalized = category.strip()
@@ -297,7 +402,7 @@ class CategoryTreePicker(QWidget):
         existing = self._item_lookup.get(key)
         if existing is not None:
             return existing
-        parts = [part.strip() for part in normalized.split(self._separator) if part.strip()]
+        parts = self._category_parts(normalized)
         if not parts:
             return self._item_lookup.get(_NONE_KEY)
         parent = self._model.invisibleRootItem()
@@ -306,33 +411,84 @@ class CategoryTreePicker(QWidget):
             path.append(part)
             path_key = tuple(path)
             item = self._node_lookup.get(path_key)
+            value = normalized if index == len(parts) - 1 else None
             if item is None:
-                item = QStandardItem(part)
-                item.setData(part, Qt.DisplayRole)
-                if index == len(parts) - 1:
-                    item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-                    item.setData(normalized, _CATEGORY_ROLE)
-                    item.setData(part, Qt.EditRole)
-                    item.setData(normalized, Qt.ToolTipRole)
-                else:
-                    item.setFlags(Qt.ItemIsEnabled)
-                    item.setData(None, _CATEGORY_ROLE)
+                item = _category_item(part, value)
                 parent.appendRow(item)
                 self._node_lookup[path_key] = item
+                self._node_values[path_key] = value
             else:
                 if item.text() != part:
                     item.setText(part)
-                item.setData(part, Qt.DisplayRole)
-                if index < len(parts) - 1:
-                    item.setFlags(Qt.ItemIsEnabled)
-                    item.setData(None, _CATEGORY_ROLE)
-                    parent_full = self._separator.join(path)
-                    self._item_lookup.pop(parent_full.lower(), None)
-                elif not (item.flags() & Qt.ItemIsSelectable):
-                    item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-                    item.setData(normalized, _CATEGORY_ROLE)
-                    item.setData(part, Qt.EditRole)
-                    item.setData(normalized, Qt.ToolTipRole)
+                if value is None:
+                    if self._node_values.get(path_key) is not None:
+                        _assign_category(item, part, None)
+                        self._node_values[path_key] = None
+                    self._item_lookup.pop(self._separator.join(path).lower(), None)
+                elif self._node_values.get(path_key) is None:
+                    _assign_category(item, part, value)
+                    self._node_values[path_key] = value
             parent = item
         self._item_lookup[key] = parent
         return parent
+
+
+def _split_category(category: str, separator: str) -> Tuple[str, ...]:
+    return tuple(part.strip() for part in category.split(separator) if part.strip())
+
+
+def _category_tree_spec(
+    categories: Dict[str, Tuple[str, ...]], separator: str
+) -> Tuple[_NodeValues, Dict[str, Tuple[str, ...]]]:
+    """Compute the tree ``_ensure_category`` builds for ``categories`` without touching Qt.
+
+    ``categories`` maps each category, in order, to its path parts. Returns the node values in
+    insertion order and the lookup of category keys to node paths.
+    """
+    nodes: _NodeValues = {}
+    lookup: Dict[str, Tuple[str, ...]] = {}
+    for category, parts in categories.items():
+        if not parts:
+            continue
+        last = len(parts) - 1
+        for index in range(len(parts)):
+            path = parts[: index + 1]
+            if index < last:
+                if path in nodes:
+                    lookup.pop(separator.join(path).lower(), None)
+                nodes[path] = None
+            elif nodes.get(path) is None:
+                nodes[path] = category
+        lookup[category.lower()] = parts
+    return nodes, lookup
+
+
+def _same_sibling_order(previous: _NodeValues, nodes: _NodeValues) -> bool:
+    """Whether nodes present in both trees appear in the same order under each parent."""
+    return _sibling_order(previous, nodes) == _sibling_order(nodes, previous)
+
+
+def _sibling_order(nodes: _NodeValues, keep: _NodeValues) -> Dict[Tuple[str, ...], list[str]]:
+    order: Dict[Tuple[str, ...], list[str]] = {}
+    for path in nodes:
+        if path in keep:
+            order.setdefault(path[:-1], []).append(path[-1])
+    return order
+
+
+def _category_item(part: str, value: Optional[str]) -> QStandardItem:
+    item = QStandardItem(part)
+    _assign_category(item, part, value)
+    return item
+
+
+def _assign_category(item: QStandardItem, part: str, value: Optional[str]) -> None:
+    if value is None:
+        item.setFlags(Qt.ItemIsEnabled)
+        item.setData(None, _CATEGORY_ROLE)
+        item.setData(None, Qt.ToolTipRole)
+        return
+    item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
+    item.setData(value, _CATEGORY_ROLE)
+    item.setData(part, Qt.EditRole)
+    item.setData(value, Qt.ToolTipRole)
@@ -42,13 +42,17 @@ class PromptService(QObject):
         self._cascade_cycle: int = 8
         self._sound_player = sound_player
 
-        self._manager.prompt_ready.connect(self._on_prompt_ready)
+        self._manager.prompts_ready.connect(self._on_prompts_ready)
         self._manager.error_occurred.connect(self._on_error)
         self._manager.segment_completed.connect(self._on_segment_completed)
         self._manager.segment_split.connect(self._on_segment_split)
         self._manager.segment_dismissed.connect(self._cleanup_dialog)
 
     # ------------------------------------------------------------------
+    def _on_prompts_ready(self, segments: list[ScheduledSegment]) -> None:
+        for segment in segments:
+            self._on_prompt_ready(segment)
+
     def _on_prompt_ready(self, segment: ScheduledSegment) -> None:
         remainders = self._manager.segment_remainders(segment)
         if not remainders:
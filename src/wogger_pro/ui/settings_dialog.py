@@ -38,7 +38,6 @@ from ..core.exporter import create_jf_excel_export
 from ..core.prompt_manager import PromptManager
 from ..core.repository import EntriesRepository
 from ..core.settings import DEFAULT_PROMPT_CRON, Settings, Theme
-from .advanced_export_dialog import AdvancedExportDialog
 from .categories_dialog import CategoriesDialog
 from .csv_import_dialog import CsvImportDialog
 from .jf_loggr_import_dialog import JfLoggrImportDialog
@@ -513,18 +512,26 @@ class SettingsDialog(QDialog):
             self._clear_error()
 
     def _on_advanced_export_clicked(self) -> None:
+        # Only loaded on demand: most sessions never open the export dialog.
+        from .advanced_export_dialog import AdvancedExportDialog
+
         try:
-            entries = self._repository.get_all_entries()
+            span = self._repository.get_entries_span()
         except Exception as exc:  # pragma: no cover - repository failures are environment specific
             LOGGER.exception("Unable to load entries for advanced export")
             QMessageBox.critical(self, "Export failed", str(exc))
             return
 
-        if not entries:
+        if span is None:
             QMessageBox.information(self, "No entries", "There are no entries available to export yet.")
             return
 
-        dialog = AdvancedExportDialog(entries, parent=self)
+        # The dialog fetches the chosen window on export, so no entry list is held while it is open.
+        dialog = AdvancedExportDialog(
+            parent=self,
+            span=span,
+            load_entries=self._repository.get_entries_overlapping,
+        )
         try:
             dialog.exec()
         except Exception as exc:  # pragma: no cover - Qt dialog errors are user specific